@@ -1,25 +1,39 @@
+import array
+import bisect
+import calendar
 import csv
 import ctypes
+import datetime
+import functools
+import json
 import math
 import logging
 import os
 import shutil
 import sys
-from typing import Optional
-from dataclasses import dataclass, field
+from collections import defaultdict
+from typing import Callable, Optional
+from dataclasses import dataclass, field, replace
 
 from PySide6.QtCore import (
+    QAbstractTableModel,
     QDate,
     QDateTime,
     QEvent,
+    QLineF,
+    QModelIndex,
+    Property,
     QPoint,
     QPointF,
     QPropertyAnimation,
+    QObject,
     QRect,
     QRectF,
+    QRunnable,
     QSettings,
     Signal,
     QSize,
+    QThreadPool,
     QTimer,
     Qt,
     QTime,
@@ -32,11 +46,13 @@ from PySide6.QtGui import (
     QColor,
     QFont,
     QFontDatabase,
+    QFontMetrics,
     QKeySequence,
     QLinearGradient,
     QPainter,
     QPainterPath,
     QPen,
+    QPolygonF,
     QShortcut,
     QShowEvent,
 )
@@ -62,6 +78,7 @@ from PySide6.QtWidgets import (
     QSpinBox,
     QStackedLayout,
     QTabWidget,
+    QTableView,
     QTableWidget,
     QTableWidgetItem,
     QHeaderView,
@@ -129,10 +146,17 @@ def init_paths() -> None:
         break
 
 
+_SETTINGS_CACHE: dict[str, QSettings] = {}
+
+
 def get_settings() -> QSettings:
     if SETTINGS_PATH == "settings.ini" and DATA_DIR is None:
         init_paths()
-    return QSettings(SETTINGS_PATH, QSettings.IniFormat)
+    settings = _SETTINGS_CACHE.get(SETTINGS_PATH)
+    if settings is None:
+        settings = QSettings(SETTINGS_PATH, QSettings.IniFormat)
+        _SETTINGS_CACHE[SETTINGS_PATH] = settings
+    return settings
 
 @dataclass
 class UiSettings:
@@ -188,6 +212,56 @@ class UiSettings:
     use_24h_time: bool = True
 
 
+UI_SETTINGS_SCHEMA: tuple[tuple[str, str, type], ...] = (
+    ("blur/radius", "blur_radius", int),
+    ("blur/opacity", "opacity", float),
+    ("colors/background", "bg_color", QColor),
+    ("colors/text", "text_color", QColor),
+    ("colors/accent", "accent_color", QColor),
+    ("colors/day_time", "day_time_color", QColor),
+    ("colors/heatmap", "heatmap_color", QColor),
+    ("colors/heatmap_hover_bg", "heatmap_hover_bg_color", QColor),
+    ("colors/heatmap_hover_text", "heatmap_hover_text_color", QColor),
+    ("colors/heatmap_hover_cell", "heatmap_hover_cell_color", QColor),
+    ("colors/graph_line", "graph_line_color", QColor),
+    ("colors/graph_dot", "graph_dot_color", QColor),
+    ("colors/graph_fill", "graph_fill_color", QColor),
+    ("colors/graph_grid", "graph_grid_color", QColor),
+    ("colors/total_today", "total_today_color", QColor),
+    ("colors/goal_left", "goal_left_color", QColor),
+    ("colors/super_goal_bar_start", "super_goal_bar_start", QColor),
+    ("colors/super_goal_bar_end", "super_goal_bar_end", QColor),
+    ("colors/super_goal_bar_bg", "super_goal_bar_bg", QColor),
+    ("heatmap/cell_size", "heatmap_cell_size", int),
+    ("heatmap/month_padding", "heatmap_month_padding", int),
+    ("heatmap/month_label_size", "heatmap_month_label_size", int),
+    ("fonts/timer", "font_size", int),
+    ("fonts/label", "label_size", int),
+    ("fonts/day_time", "day_time_font_size", int),
+    ("fonts/total_today", "total_today_font_size", int),
+    ("fonts/goal_left", "goal_left_font_size", int),
+    ("super_goal_bar/width", "super_goal_bar_width", int),
+    ("super_goal_bar/height", "super_goal_bar_height", int),
+    ("goal_pulse/seconds", "goal_pulse_seconds", float),
+    ("window/always_on_top", "always_on_top", bool),
+    ("day_time/start_hour", "day_start_hour", int),
+    ("day_time/start_minute", "day_start_minute", int),
+    ("day_time/end_hour", "day_end_hour", int),
+    ("day_time/end_minute", "day_end_minute", int),
+    ("ui/show_heatmap", "show_heatmap", bool),
+    ("ui/show_day_time", "show_day_time", bool),
+    ("ui/show_total_today", "show_total_today", bool),
+    ("ui/show_year_total", "show_year_total", bool),
+    ("ui/show_super_goal_left", "show_super_goal_left", bool),
+    ("ui/show_status_label", "show_status_label", bool),
+    ("ui/show_start_button", "show_start_button", bool),
+    ("ui/show_clock_button", "show_clock_button", bool),
+    ("ui/show_longest_streak", "show_longest_streak", bool),
+    ("ui/show_current_streak", "show_current_streak", bool),
+    ("ui/use_24h_time", "use_24h_time", bool),
+)
+
+
 @dataclass
 class HotkeySettings:
     start_hotkey: str = ""
@@ -196,6 +270,14 @@ class HotkeySettings:
     clock_xinput_button: str = ""
 
 
+HOTKEY_SETTINGS_SCHEMA = (
+    ("hotkeys/start", "start_hotkey"),
+    ("hotkeys/clock", "clock_hotkey"),
+    ("xinput/start_button", "start_xinput_button"),
+    ("xinput/clock_button", "clock_xinput_button"),
+)
+
+
 @dataclass(frozen=True)
 class GraphSeries:
     label: str
@@ -419,8 +501,13 @@ class GamepadReader:
         return self._backend.read_buttons(index)
 
 
+@functools.lru_cache(maxsize=256)
+def _rgb_to_hex(rgb: int) -> str:
+    return f"#{rgb & 0xFFFFFF:06x}"
+
+
 def qcolor_to_hex(color: QColor) -> str:
-    return color.name(QColor.HexRgb)
+    return _rgb_to_hex(color.rgb())
 
 
 def hex_to_qcolor(value: str, fallback: QColor) -> QColor:
@@ -474,6 +561,50 @@ def format_duration_hms(total_seconds: int) -> str:
     return f"{hours}h {minutes}m {seconds}s"
 
 
+_TWO_DIGITS = tuple(f"{value:02d}" for value in range(100))
+
+
+def format_clock(total_seconds: int, pad_hours: bool = True) -> str:
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    if pad_hours and hours < 100:
+        hours_text = _TWO_DIGITS[hours]
+    else:
+        hours_text = str(hours)
+    return f"{hours_text}:{_TWO_DIGITS[minutes]}:{_TWO_DIGITS[seconds]}"
+
+
+@functools.lru_cache(maxsize=8)
+def month_geometry(year: int) -> tuple[tuple[int, int, int, int], ...]:
+    months = []
+    for month in range(1, 13):
+        leading_blanks, days_in_month = calendar.monthrange(year, month)
+        total_cells = leading_blanks + days_in_month
+        weeks = (total_cells + 6) // 7
+        months.append((month, days_in_month, leading_blanks, weeks))
+    return tuple(months)
+
+
+@functools.lru_cache(maxsize=4096)
+def compute_end_time(start_time: str, duration: int) -> str:
+    time = QTime.fromString(start_time, "HH:mm:ss")
+    if not time.isValid():
+        time = QTime.fromString(start_time, "HH:mm")
+    if not time.isValid():
+        return "N/A"
+    return time.addSecs(duration).toString("HH:mm:ss")
+
+
+def copy_log_data(
+    entries: list[dict[str, object]], totals: dict[str, int], goals: dict[str, int]
+) -> tuple[list[dict[str, object]], defaultdict[str, int], dict[str, int]]:
+    return [dict(entry) for entry in entries], defaultdict(int, totals), dict(goals)
+
+
+def goals_file_path(log_path: str) -> str:
+    return os.path.splitext(log_path)[0] + GOAL_FILE_SUFFIX
+
+
 def format_percent(part_seconds: int, goal_seconds: int) -> str:
     if goal_seconds <= 0:
         return "N/A"
@@ -481,10 +612,95 @@ def format_percent(part_seconds: int, goal_seconds: int) -> str:
     return f"{percent:.0f}%"
 
 
+def streak_lengths(met_days: list[int], today_ordinal: int) -> tuple[int, int]:
+    longest = 0
+    running = 0
+    prev_day = None
+    for day in met_days:
+        if prev_day is not None and day == prev_day + 1:
+            running += 1
+        else:
+            running = 1
+        if running > longest:
+            longest = running
+        prev_day = day
+    if prev_day is None or prev_day < today_ordinal - 1:
+        return longest, 0
+    return longest, running
+
+
+def heatmap_alpha(seconds: int, goal_seconds: int) -> int:
+    met = 0 < goal_seconds <= seconds
+    return _HEATMAP_ALPHA_TABLE[(seconds > 0) | (met << 1)]
+
+
+_FONT_CACHE: dict[tuple[str, int, bool], QFont] = {}
+
+
+def cached_font(family: str, size: int, bold: bool = False) -> QFont:
+    key = (family, size, bold)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = QFont(family, size, QFont.Bold if bold else QFont.Normal)
+        _FONT_CACHE[key] = font
+    return font
+
+
+_DATE_KEY_CACHE: dict[int, str] = {}
+_DATE_KEY_CACHE_SIZE = 4096
+
+
+def qdate_to_key(date: QDate) -> str:
+    julian_day = date.toJulianDay()
+    key = _DATE_KEY_CACHE.get(julian_day)
+    if key is None:
+        key = date.toString("yyyy-MM-dd")
+        if len(_DATE_KEY_CACHE) < _DATE_KEY_CACHE_SIZE:
+            _DATE_KEY_CACHE[julian_day] = key
+    return key
+
+
 LOGGER = logging.getLogger("countdown")
+LOG_FILE_BUFFER_SIZE = 1 << 20
+LOG_FILE_HEADER = (
+    "date",
+    "start_time",
+    "end_time",
+    "duration_seconds",
+    "goal_seconds",
+    "label",
+)
+GOAL_FILE_SUFFIX = ".goals.json"
 HEATMAP_CELL_SIZE_MIN = 2
+HEATMAP_ALPHA_LEVELS = (40, 120, 220)
+HEATMAP_CELL_BASE_RULE = (
+    "QFrame#heatmapCell {border-radius: 2px; background-color: rgba(0, 0, 0, 0);}"
+)
+HEATMAP_CELL_LEVEL_RULE = (
+    'QFrame#heatmapCell[heatShade="{shade}"][heatAlpha="{alpha}"] '
+    "{{background-color: rgba({red}, {green}, {blue}, {alpha});}}"
+)
+HEATMAP_CELL_HOVER_RULE = (
+    ", ".join(
+        f'QFrame#heatmapCell[heatAlpha="{alpha}"]:hover'
+        for alpha in HEATMAP_ALPHA_LEVELS
+    )
+    + " {{background-color: {color};}}"
+)
+_HEATMAP_ALPHA_TABLE = (
+    HEATMAP_ALPHA_LEVELS[0],
+    HEATMAP_ALPHA_LEVELS[1],
+    HEATMAP_ALPHA_LEVELS[2],
+    HEATMAP_ALPHA_LEVELS[2],
+)
 HEATMAP_CELL_SIZE_MAX = 20
 YEAR_TOTAL_DISPLAY_MODES = ("hours", "days", "week", "avg_week")
+YEAR_TOTAL_NEXT_DISPLAY = {
+    mode: YEAR_TOTAL_DISPLAY_MODES[(index + 1) % len(YEAR_TOTAL_DISPLAY_MODES)]
+    for index, mode in enumerate(YEAR_TOTAL_DISPLAY_MODES)
+}
+STREAK_REFRESH_TICKS = 5
+PROFILE_CACHE_LIMIT = 2
 DEFAULT_PROFILES = (
     ("Activate Immersion", "active.csv"),
     ("Passive Immersion", "passive.csv"),
@@ -504,6 +720,7 @@ def _ensure_data_file_path(self, path: str) -> None:
 DEFAULT_PROFILE_NAME = "Activate Immersion"
 PROFILE_ACTION_ADD = "__add_profile__"
 PROFILE_ACTION_DELETE = "__delete_profile__"
+RESERVED_PROFILE_LABELS = frozenset({"add profile", "delete profile"})
 PROFILE_COLOR_PALETTE = (
     "#38bdf8",
     "#f472b6",
@@ -861,6 +1078,25 @@ class SettingsDialog(QDialog):
         self.super_goal_bar_start_btn = QPushButton()
         self.super_goal_bar_end_btn = QPushButton()
         self.super_goal_bar_bg_btn = QPushButton()
+        self._spin_map = {
+            "blur_radius": self.blur_spin,
+            "opacity": self.opacity_spin,
+            "font_size": self.font_spin,
+            "label_size": self.label_spin,
+            "day_time_font_size": self.day_time_font_spin,
+            "day_start_hour": self.day_start_hour_spin,
+            "day_start_minute": self.day_start_minute_spin,
+            "day_end_hour": self.day_end_hour_spin,
+            "day_end_minute": self.day_end_minute_spin,
+            "heatmap_cell_size": self.heatmap_size_spin,
+            "heatmap_month_padding": self.heatmap_month_padding_spin,
+            "heatmap_month_label_size": self.heatmap_month_label_spin,
+            "total_today_font_size": self.total_today_font_spin,
+            "goal_left_font_size": self.goal_left_font_spin,
+            "super_goal_bar_width": self.super_goal_bar_width_spin,
+            "super_goal_bar_height": self.super_goal_bar_height_spin,
+            "goal_pulse_seconds": self.goal_pulse_spin,
+        }
         self._sync_color_btns()
 
         self.bg_btn.clicked.connect(lambda: self._pick_color("bg"))
@@ -1174,61 +1410,18 @@ class SettingsDialog(QDialog):
         self._sync_color_btns()
 
     def updated_settings(self) -> UiSettings:
-        blur_radius = self.blur_spin.value() if self._blur_supported else 0
-        use_24h_time = bool(self.time_format_combo.currentData())
-        return UiSettings(
-            blur_radius=blur_radius,
-            opacity=self.opacity_spin.value(),
-            bg_color=self._settings.bg_color,
-            text_color=self._settings.text_color,
-            accent_color=self._settings.accent_color,
-            font_size=self.font_spin.value(),
-            label_size=self.label_spin.value(),
-            day_time_color=self._settings.day_time_color,
-            day_time_font_size=self.day_time_font_spin.value(),
-            day_start_hour=self.day_start_hour_spin.value(),
-            day_start_minute=self.day_start_minute_spin.value(),
-            day_end_hour=self.day_end_hour_spin.value(),
-            day_end_minute=self.day_end_minute_spin.value(),
-            heatmap_color=self._settings.heatmap_color,
-            heatmap_hover_bg_color=self._settings.heatmap_hover_bg_color,
-            heatmap_hover_text_color=self._settings.heatmap_hover_text_color,
-            heatmap_hover_cell_color=self._settings.heatmap_hover_cell_color,
-            heatmap_cell_size=self.heatmap_size_spin.value(),
-            heatmap_month_padding=self.heatmap_month_padding_spin.value(),
-            heatmap_month_label_size=self.heatmap_month_label_spin.value(),
-            graph_line_color=self._settings.graph_line_color,
-            graph_dot_color=self._settings.graph_dot_color,
-            graph_fill_color=self._settings.graph_fill_color,
-            graph_grid_color=self._settings.graph_grid_color,
+        values = {key: spin.value() for key, spin in self._spin_map.items()}
+        if not self._blur_supported:
+            values["blur_radius"] = 0
+        return replace(
+            self._settings,
+            **values,
             graph_range_date_format=str(
                 self.graph_range_format_combo.currentData()
             ),
-            total_today_color=self._settings.total_today_color,
-            total_today_font_size=self.total_today_font_spin.value(),
-            goal_left_color=self._settings.goal_left_color,
-            goal_left_font_size=self.goal_left_font_spin.value(),
-            super_goal_bar_start=self._settings.super_goal_bar_start,
-            super_goal_bar_end=self._settings.super_goal_bar_end,
-            super_goal_bar_bg=self._settings.super_goal_bar_bg,
-            super_goal_bar_width=self.super_goal_bar_width_spin.value(),
-            super_goal_bar_height=self.super_goal_bar_height_spin.value(),
-            goal_pulse_seconds=self.goal_pulse_spin.value(),
-            always_on_top=self._settings.always_on_top,
-            year_total_display=self._settings.year_total_display,
             week_start_day=int(self.week_start_combo.currentData()),
             week_end_day=int(self.week_end_combo.currentData()),
-            show_heatmap=self._settings.show_heatmap,
-            show_day_time=self._settings.show_day_time,
-            show_total_today=self._settings.show_total_today,
-            show_year_total=self._settings.show_year_total,
-            show_super_goal_left=self._settings.show_super_goal_left,
-            show_status_label=self._settings.show_status_label,
-            show_start_button=self._settings.show_start_button,
-            show_clock_button=self._settings.show_clock_button,
-            show_longest_streak=self._settings.show_longest_streak,
-            show_current_streak=self._settings.show_current_streak,
-            use_24h_time=use_24h_time,
+            use_24h_time=bool(self.time_format_combo.currentData()),
         )
 
 
@@ -1443,11 +1636,11 @@ class AnimatedToggleButton(QPushButton):
         self._radius = self._default_radius
         self._press_value = 0.0
         self._is_active = False
+        self._style_sheet = ""
 
-        self._color_anim = QVariantAnimation(self)
+        self._color_anim = QPropertyAnimation(self, b"bgColor", self)
         self._color_anim.setDuration(200)
         self._color_anim.setEasingCurve(QEasingCurve.InOutQuad)
-        self._color_anim.valueChanged.connect(self._on_color_anim)
 
         self._press_anim = QVariantAnimation(self)
         self._press_anim.setDuration(90)
@@ -1477,16 +1670,22 @@ class AnimatedToggleButton(QPushButton):
             self._update_style()
 
     def _animate_to_color(self, target: QColor) -> None:
-        if self._color_anim.state() == QVariantAnimation.Running:
+        if self._color_anim.state() == QPropertyAnimation.Running:
             self._color_anim.stop()
         self._color_anim.setStartValue(self._bg_color)
         self._color_anim.setEndValue(target)
         self._color_anim.start()
 
-    def _on_color_anim(self, value) -> None:
-        if isinstance(value, QColor):
-            self._bg_color = value
-            self._update_style()
+    def _get_bg_color(self) -> QColor:
+        return self._bg_color
+
+    def _set_bg_color(self, value: QColor) -> None:
+        if value.rgb() == self._bg_color.rgb():
+            return
+        self._bg_color = QColor(value)
+        self._update_style()
+
+    bgColor = Property(QColor, _get_bg_color, _set_bg_color)
 
     def _on_press_anim(self, value) -> None:
         self._press_value = float(value)
@@ -1502,11 +1701,15 @@ class AnimatedToggleButton(QPushButton):
     def _update_style(self) -> None:
         pad_y = max(0, self._base_padding_y - int(self._press_value * 2))
         pad_x = max(0, self._base_padding_x - int(self._press_value * 2))
-        self.setStyleSheet(
+        style = (
             f"padding: {pad_y}px {pad_x}px; border-radius: {self._radius}px;"
             f"background-color: {qcolor_to_hex(self._bg_color)};"
             f"color: {qcolor_to_hex(self._text_color)};"
         )
+        if style == self._style_sheet:
+            return
+        self._style_sheet = style
+        self.setStyleSheet(style)
 
     def set_scale(self, scale: float) -> None:
         scale = max(0.6, min(2.0, float(scale)))
@@ -1554,6 +1757,8 @@ class SuperGoalProgressBar(QWidget):
         self._start_color = start_color
         self._end_color = end_color
         self._bg_color = bg_color
+        self._cached_key: Optional[tuple[float, float, float]] = None
+        self._cached_path: Optional[QPainterPath] = None
         self.setFixedSize(max(1, width), max(1, height))
 
     def set_colors(
@@ -1568,23 +1773,41 @@ class SuperGoalProgressBar(QWidget):
         self.setFixedSize(max(1, width), max(1, height))
         self.update()
 
+    def _fill_half_pixels(self, progress: float) -> int:
+        return int(round(progress * self.width() * 2))
+
     def set_progress(self, progress: float) -> None:
         clamped = max(0.0, min(1.0, float(progress)))
         if math.isclose(self._progress, clamped):
             return
+        unchanged = self._fill_half_pixels(clamped) == self._fill_half_pixels(
+            self._progress
+        )
         self._progress = clamped
+        if unchanged:
+            return
         self.update()
 
+    def _rounded_path(self, rect: QRectF, radius: float) -> QPainterPath:
+        key = (rect.width(), rect.height(), radius)
+        if self._cached_path is None or self._cached_key != key:
+            path = QPainterPath()
+            path.addRoundedRect(rect, radius, radius)
+            self._cached_key = key
+            self._cached_path = path
+        return self._cached_path
+
     def paintEvent(self, event) -> None:
         rect = QRectF(self.rect())
         if rect.width() <= 0 or rect.height() <= 0:
             return
         radius = min(rect.height() / 2.0, 6.0)
+        path = self._rounded_path(rect, radius)
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing, True)
         painter.setPen(Qt.NoPen)
         painter.setBrush(self._bg_color)
-        painter.drawRoundedRect(rect, radius, radius)
+        painter.drawPath(path)
         if self._progress <= 0:
             return
         painter.save()
@@ -1594,47 +1817,82 @@ class SuperGoalProgressBar(QWidget):
         gradient.setColorAt(0.0, self._start_color)
         gradient.setColorAt(1.0, self._end_color)
         painter.setBrush(QBrush(gradient))
-        painter.drawRoundedRect(rect, radius, radius)
+        painter.drawPath(path)
         painter.restore()
 
 
 class GlowFrame(QFrame):
+    _LAYERS = (
+        (8, 50),
+        (5, 90),
+        (2, 180),
+    )
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self._intensity = 0.0
         self._color = QColor("#ff3b30")
         self._radius = 18
+        self._cached_key: Optional[tuple[int, int, int]] = None
+        self._cached_paths: list[tuple[int, int, QPainterPath]] = []
+        self._alphas = self._layer_alphas(self._intensity)
+        self._pens_key: Optional[tuple] = None
+        self._pens: list[QPen] = []
         self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
         self.setAttribute(Qt.WA_NoSystemBackground, True)
         self.setAttribute(Qt.WA_TranslucentBackground, True)
 
+    def _layer_alphas(self, intensity: float) -> tuple[int, ...]:
+        return tuple(int(alpha * intensity) for _, alpha in self._LAYERS)
+
     def set_intensity(self, value: float) -> None:
         value = max(0.0, min(1.0, float(value)))
         if abs(self._intensity - value) < 0.001:
             return
+        alphas = self._layer_alphas(value)
         self._intensity = value
+        if alphas == self._alphas:
+            return
+        self._alphas = alphas
         self.update()
 
+    def _layer_paths(self) -> list[tuple[int, int, QPainterPath]]:
+        key = (self.width(), self.height(), self._radius)
+        if self._cached_key != key:
+            paths: list[tuple[int, int, QPainterPath]] = []
+            for width, alpha in self._LAYERS:
+                inset = int(width / 2) + 1
+                rect = self.rect().adjusted(inset, inset, -inset, -inset)
+                path = QPainterPath()
+                path.addRoundedRect(QRectF(rect), self._radius, self._radius)
+                paths.append((width, alpha, path))
+            self._cached_key = key
+            self._cached_paths = paths
+        return self._cached_paths
+
+    def _layer_pens(self) -> list[QPen]:
+        key = (self._alphas, self._color.rgba())
+        if self._pens_key != key:
+            pens: list[QPen] = []
+            for (width, _), alpha in zip(self._LAYERS, self._alphas):
+                color = QColor(self._color)
+                color.setAlpha(alpha)
+                pen = QPen(color, width)
+                pen.setJoinStyle(Qt.RoundJoin)
+                pens.append(pen)
+            self._pens_key = key
+            self._pens = pens
+        return self._pens
+
     def paintEvent(self, event) -> None:
-        if self._intensity <= 0.0:
+        if not any(self._alphas):
             return
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing, True)
-        base = QColor(self._color)
-        layers = [
-            (8, 50),
-            (5, 90),
-            (2, 180),
-        ]
-        for width, alpha in layers:
-            color = QColor(base)
-            color.setAlpha(int(alpha * self._intensity))
-            pen = QPen(color, width)
-            pen.setJoinStyle(Qt.RoundJoin)
+        painter.setBrush(Qt.NoBrush)
+        for pen, (_, _, path) in zip(self._layer_pens(), self._layer_paths()):
             painter.setPen(pen)
-            inset = int(width / 2) + 1
-            rect = self.rect().adjusted(inset, inset, -inset, -inset)
-            painter.drawRoundedRect(rect, self._radius, self._radius)
+            painter.drawPath(path)
 
 
 class CalendarHeaderWidget(QWidget):
@@ -2735,6 +2993,32 @@ class TrendsGraphWidget(QWidget):
         self._dot_radius = 4
         self._range_end = QDate.currentDate()
         self._year_anchor: Optional[int] = None
+        self._monthly_cache: dict[
+            str, tuple[tuple[int, int], dict[tuple[int, int], int]]
+        ] = {}
+        self._daily_cache_key: Optional[tuple[int, int]] = None
+        self._daily_cache: tuple[list[QDate], list[str]] = ([], [])
+        self._grid_cache_key: Optional[tuple[int, int, int, int, int]] = None
+        self._grid_lines: list[QLineF] = []
+        self._grid_ys: list[float] = []
+        self._tick_cache_key: Optional[tuple] = None
+        self._tick_labels: list[tuple[QRectF, str]] = []
+        self._plot_left = 0.0
+        self._step_x = 0.0
+        self._label_cache_key: Optional[tuple] = None
+        self._label_cache: list[tuple[int, int, str]] = []
+        self._palette_key: Optional[tuple] = None
+        self._palette: dict[str, QColor] = {}
+        self._series_palette: dict[str, tuple[QColor, QColor, QPen, QColor]] = {}
+        self._axis_pen = QPen()
+        self._grid_pen_key: Optional[tuple[int, int]] = None
+        self._grid_pen = QPen()
+        self._fill_gradient_key: Optional[tuple[int, int]] = None
+        self._fill_gradients: dict[str, QLinearGradient] = {}
+        self._tick_font: Optional[QFont] = None
+        self._tick_metrics: Optional[QFontMetrics] = None
+        self._label_font: Optional[QFont] = None
+        self._label_metrics: Optional[QFontMetrics] = None
         self.setMinimumHeight(240)
         self.setMinimumWidth(420)
         self.setMouseTracking(True)
@@ -2809,25 +3093,33 @@ class TrendsGraphWidget(QWidget):
         rest = [s for s in series if s.label != self._active_label]
         return rest + active if active else list(series)
 
-    def _build_daily_dates(self, days: int) -> list[QDate]:
+    def _build_daily_dates(self, days: int) -> tuple[list[QDate], list[str]]:
         if self._is_year_range():
             year = self._year_anchor or QDate.currentDate().year()
             start = QDate(year, 1, 1)
             today = QDate.currentDate()
             if year > today.year():
-                return []
+                return [], []
             if year == today.year():
                 total_days = today.dayOfYear()
             else:
                 total_days = self._year_length(year)
-            return [start.addDays(offset) for offset in range(total_days)]
-        end = self._range_end
-        start = end.addDays(-(days - 1))
-        dates: list[QDate] = []
-        for offset in range(days):
-            date = start.addDays(offset)
-            dates.append(date)
-        return dates
+        else:
+            start = self._range_end.addDays(-(days - 1))
+            total_days = days
+        key = (start.toJulianDay(), total_days)
+        if self._daily_cache_key != key:
+            first = datetime.date(start.year(), start.month(), start.day())
+            days_list = [
+                first + datetime.timedelta(days=offset)
+                for offset in range(total_days)
+            ]
+            self._daily_cache = (
+                [QDate(day.year, day.month, day.day) for day in days_list],
+                [day.isoformat() for day in days_list],
+            )
+            self._daily_cache_key = key
+        return self._daily_cache
 
     def _year_length(self, year: int) -> int:
         if (year % 4) != 0:
@@ -2850,11 +3142,11 @@ class TrendsGraphWidget(QWidget):
         return self._scale in ("week", "month") and self._range_days >= 365
 
     def _values_for_dates(
-        self, totals: dict[str, int], dates: list[QDate]
+        self, totals: dict[str, int], date_keys: list[str]
     ) -> list[int]:
         values: list[int] = []
-        for date in dates:
-            value = totals.get(date.toString("yyyy-MM-dd"), 0)
+        for date_key in date_keys:
+            value = totals.get(date_key, 0)
             try:
                 values.append(int(value))
             except (TypeError, ValueError):
@@ -2866,20 +3158,38 @@ class TrendsGraphWidget(QWidget):
         start = QDate(end.year(), end.month(), 1).addMonths(-11)
         return [start.addMonths(offset) for offset in range(12)]
 
-    def _values_for_months(
-        self, totals: dict[str, int], dates: list[QDate]
-    ) -> list[int]:
-        monthly_totals: dict[tuple[int, int], int] = {}
-        for date_key, value in totals.items():
-            date = QDate.fromString(date_key, "yyyy-MM-dd")
-            if not date.isValid():
-                continue
+    def _monthly_totals(self, series: GraphSeries) -> dict[tuple[int, int], int]:
+        key = (id(series.totals), len(series.totals))
+        cached = self._monthly_cache.get(series.label)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        by_prefix: defaultdict[str, int] = defaultdict(int)
+        for date_key, value in series.totals.items():
             try:
-                seconds = int(value)
+                by_prefix[str(date_key)[:7]] += int(value)
             except (TypeError, ValueError):
                 continue
-            key = (date.year(), date.month())
-            monthly_totals[key] = monthly_totals.get(key, 0) + seconds
+        monthly_totals: defaultdict[tuple[int, int], int] = defaultdict(int)
+        for prefix, seconds in by_prefix.items():
+            parts = prefix.split("-")
+            if len(parts) != 2:
+                continue
+            try:
+                year = int(parts[0])
+                month = int(parts[1])
+            except ValueError:
+                continue
+            if not 1 <= month <= 12:
+                continue
+            monthly_totals[(year, month)] += seconds
+        totals = dict(monthly_totals)
+        self._monthly_cache[series.label] = (key, totals)
+        return totals
+
+    def _values_for_months(
+        self, series: GraphSeries, dates: list[QDate]
+    ) -> list[int]:
+        monthly_totals = self._monthly_totals(series)
         values: list[int] = []
         for date in dates:
             values.append(monthly_totals.get((date.year(), date.month()), 0))
@@ -2891,10 +3201,151 @@ class TrendsGraphWidget(QWidget):
         step = max(1, int(math.ceil(count / 7)))
         return range(0, count, step)
 
+    def _grid_geometry(
+        self, plot_rect: QRect, max_hours: int
+    ) -> tuple[list[QLineF], list[float]]:
+        key = (
+            plot_rect.left(),
+            plot_rect.top(),
+            plot_rect.right(),
+            plot_rect.bottom(),
+            max_hours,
+        )
+        if self._grid_cache_key != key:
+            ys = [
+                plot_rect.bottom() - ((hour / max_hours) * plot_rect.height())
+                for hour in range(max_hours + 1)
+            ]
+            self._grid_lines = [
+                QLineF(plot_rect.left(), y, plot_rect.right(), y) for y in ys
+            ]
+            self._grid_ys = ys
+            self._grid_cache_key = key
+        return self._grid_lines, self._grid_ys
+
+    def _tick_label_rects(
+        self, plot_rect: QRect, max_hours: int, metrics: QFontMetrics
+    ) -> list[tuple[QRectF, str]]:
+        _, grid_ys = self._grid_geometry(plot_rect, max_hours)
+        height = metrics.height()
+        key = (self._grid_cache_key, height)
+        if self._tick_cache_key != key:
+            tick_width = max(0, plot_rect.left() - 6)
+            self._tick_labels = [
+                (QRectF(0, y - (height / 2), tick_width, height), str(hour))
+                for hour, y in enumerate(grid_ys)
+            ]
+            self._tick_cache_key = key
+        return self._tick_labels
+
+    def _alpha_color(self, color: QColor, alpha: int) -> QColor:
+        result = QColor(color)
+        result.setAlpha(alpha)
+        return result
+
+    def _ensure_palette(self) -> None:
+        grid = self._settings.graph_grid_color
+        text = self._settings.text_color
+        key = (
+            grid.rgba(),
+            text.rgba(),
+            self._active_label,
+            tuple(
+                (
+                    series.label,
+                    series.line_color.rgba(),
+                    series.dot_color.rgba(),
+                    series.fill_color.rgba(),
+                )
+                for series in self._series
+            ),
+        )
+        if self._palette_key == key:
+            return
+        self._palette = {
+            "grid_start": self._alpha_color(grid, 0),
+            "grid_end": self._alpha_color(grid, 140),
+            "tick": self._alpha_color(grid, 210),
+            "axis": self._alpha_color(grid, 180),
+            "range_label": self._alpha_color(text, 190),
+            "axis_label": self._alpha_color(text, 200),
+        }
+        self._axis_pen = QPen(self._palette["axis"], 1.2)
+        self._series_palette = {}
+        for series in self._series:
+            active = series.label == self._active_label
+            line_pen = QPen(
+                self._alpha_color(series.line_color, 230 if active else 180),
+                2.6 if active else 2.0,
+            )
+            line_pen.setCapStyle(Qt.RoundCap)
+            line_pen.setJoinStyle(Qt.RoundJoin)
+            self._series_palette[series.label] = (
+                self._alpha_color(series.fill_color, 100 if active else 70),
+                self._alpha_color(series.fill_color, 0),
+                line_pen,
+                self._alpha_color(series.dot_color, 230 if active else 180),
+            )
+        self._grid_pen_key = None
+        self._fill_gradient_key = None
+        self._palette_key = key
+
+    def _grid_pen_for(self, plot_rect: QRect) -> QPen:
+        key = (plot_rect.left(), plot_rect.right())
+        if self._grid_pen_key != key:
+            gradient = QLinearGradient(plot_rect.left(), 0, plot_rect.right(), 0)
+            gradient.setColorAt(0, self._palette["grid_start"])
+            gradient.setColorAt(1, self._palette["grid_end"])
+            self._grid_pen = QPen(QBrush(gradient), 1)
+            self._grid_pen_key = key
+        return self._grid_pen
+
+    def _fill_gradient_for(self, label: str, plot_rect: QRect) -> QLinearGradient:
+        key = (plot_rect.top(), plot_rect.bottom())
+        if self._fill_gradient_key != key:
+            self._fill_gradients = {}
+            self._fill_gradient_key = key
+        gradient = self._fill_gradients.get(label)
+        if gradient is None:
+            fill_top, fill_bottom, _, _ = self._series_palette[label]
+            gradient = QLinearGradient(0, plot_rect.top(), 0, plot_rect.bottom())
+            gradient.setColorAt(0, fill_top)
+            gradient.setColorAt(1, fill_bottom)
+            self._fill_gradients[label] = gradient
+        return gradient
+
+    def _shrunk_font(self, base: QFont, delta: int, minimum: int) -> QFont:
+        font = QFont(base)
+        point_size = font.pointSize()
+        if point_size > 0:
+            font.setPointSize(max(minimum, point_size - delta))
+        else:
+            pixel_size = font.pixelSize()
+            if pixel_size > 0:
+                font.setPixelSize(max(minimum, pixel_size - delta))
+        return font
+
+    def _ensure_fonts(self) -> None:
+        if self._tick_font is not None:
+            return
+        base_font = self.font()
+        self._tick_font = self._shrunk_font(base_font, 2, 7)
+        self._tick_metrics = QFontMetrics(self._tick_font)
+        self._label_font = self._shrunk_font(base_font, 1, 8)
+        self._label_metrics = QFontMetrics(self._label_font)
+
+    def changeEvent(self, event) -> None:
+        super().changeEvent(event)
+        if event.type() == QEvent.FontChange:
+            self._tick_font = None
+            self._tick_metrics = None
+            self._label_font = None
+            self._label_metrics = None
+
     def _tooltip_date_label(self, date: QDate) -> str:
         if self._scale == "year":
             return date.toString("MMM yyyy")
-        return date.toString("yyyy-MM-dd")
+        return qdate_to_key(date)
 
     def _range_label_format(self) -> str:
         fmt = (self._settings.graph_range_date_format or "mm/dd/yy").lower()
@@ -2932,10 +3383,11 @@ class TrendsGraphWidget(QWidget):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing, True)
 
+        date_keys: list[str] = []
         if self._scale == "year":
             dates = self._build_month_dates()
         else:
-            dates = self._build_daily_dates(self._range_days)
+            dates, date_keys = self._build_daily_dates(self._range_days)
 
         if not dates:
             return
@@ -2952,9 +3404,9 @@ class TrendsGraphWidget(QWidget):
         max_value = 0
         for series in visible_series:
             if self._scale == "year":
-                values = self._values_for_months(series.totals, dates)
+                values = self._values_for_months(series, dates)
             else:
-                values = self._values_for_dates(series.totals, dates)
+                values = self._values_for_dates(series.totals, date_keys)
             values_by_series[series.label] = values
             if values:
                 max_value = max(max_value, max(values))
@@ -2995,69 +3447,42 @@ class TrendsGraphWidget(QWidget):
             if count > 1
             else 0
         )
+        self._plot_left = float(plot_rect.left())
+        self._step_x = float(step_x)
+        plot_left = plot_rect.left()
+        plot_bottom = plot_rect.bottom()
+        y_scale = plot_rect.height() / scale_seconds
         for series in visible_series:
             values = values_by_series.get(series.label, [])
-            points: list[QPointF] = []
-            for idx, value in enumerate(values):
-                clamped_value = min(value, scale_seconds)
-                ratio = (
-                    clamped_value / scale_seconds if scale_seconds > 0 else 0
+            self._points_by_series[series.label] = [
+                QPointF(
+                    plot_left + (step_x * idx),
+                    plot_bottom - (min(value, scale_seconds) * y_scale),
                 )
-                x = plot_rect.left() + (step_x * idx)
-                y = plot_rect.bottom() - (ratio * plot_rect.height())
-                points.append(QPointF(x, y))
-            self._points_by_series[series.label] = points
+                for idx, value in enumerate(values)
+            ]
 
         max_hours = int(scale_seconds // 3600) if scale_seconds > 0 else 0
         if max_hours == 0:
             max_hours = 1
-        grid_color = QColor(self._settings.graph_grid_color)
-        grid_start = QColor(grid_color)
-        grid_start.setAlpha(0)
-        grid_end = QColor(grid_color)
-        grid_end.setAlpha(140)
-        grid_gradient = QLinearGradient(
-            plot_rect.left(), 0, plot_rect.right(), 0
-        )
-        grid_gradient.setColorAt(0, grid_start)
-        grid_gradient.setColorAt(1, grid_end)
-        grid_pen = QPen(QBrush(grid_gradient), 1)
-        painter.setPen(grid_pen)
-        for hour in range(max_hours + 1):
-            ratio = hour / max_hours if max_hours > 0 else 0
-            y = plot_rect.bottom() - (ratio * plot_rect.height())
-            painter.drawLine(plot_rect.left(), y, plot_rect.right(), y)
-
-        tick_color = QColor(self._settings.graph_grid_color)
-        tick_color.setAlpha(210)
-        painter.setPen(tick_color)
-        base_font = QFont(painter.font())
-        tick_font = QFont(base_font)
-        point_size = tick_font.pointSize()
-        if point_size > 0:
-            tick_font.setPointSize(max(7, point_size - 2))
-        else:
-            pixel_size = tick_font.pixelSize()
-            if pixel_size > 0:
-                tick_font.setPixelSize(max(7, pixel_size - 2))
-        painter.setFont(tick_font)
-        metrics = painter.fontMetrics()
-        tick_width = plot_rect.left() - 6
-        for hour in range(max_hours + 1):
-            ratio = hour / max_hours if max_hours > 0 else 0
-            y = plot_rect.bottom() - (ratio * plot_rect.height())
-            label_rect = QRectF(
-                0,
-                y - (metrics.height() / 2),
-                max(0, tick_width),
-                metrics.height(),
-            )
-            painter.drawText(label_rect, Qt.AlignRight | Qt.AlignVCenter, str(hour))
+        self._ensure_palette()
+        palette = self._palette
+        painter.setPen(self._grid_pen_for(plot_rect))
+        grid_lines, _ = self._grid_geometry(plot_rect, max_hours)
+        painter.drawLines(grid_lines)
+
+        painter.setPen(palette["tick"])
+        self._ensure_fonts()
+        base_font = painter.font()
+        painter.setFont(self._tick_font)
+        tick_flags = Qt.AlignRight | Qt.AlignVCenter
+        for label_rect, text in self._tick_label_rects(
+            plot_rect, max_hours, self._tick_metrics
+        ):
+            painter.drawText(label_rect, tick_flags, text)
 
         painter.setFont(base_font)
-        axis_color = QColor(self._settings.graph_grid_color)
-        axis_color.setAlpha(180)
-        painter.setPen(QPen(axis_color, 1.2))
+        painter.setPen(self._axis_pen)
         painter.drawLine(plot_rect.bottomLeft(), plot_rect.bottomRight())
 
         if dates:
@@ -3066,19 +3491,9 @@ class TrendsGraphWidget(QWidget):
                 f"{dates[0].toString(date_format)}–"
                 f"{dates[-1].toString(date_format)}"
             )
-            label_font = QFont(base_font)
-            point_size = label_font.pointSize()
-            if point_size > 0:
-                label_font.setPointSize(max(8, point_size - 1))
-            else:
-                pixel_size = label_font.pixelSize()
-                if pixel_size > 0:
-                    label_font.setPixelSize(max(8, pixel_size - 1))
-            painter.setFont(label_font)
-            label_color = QColor(self._settings.text_color)
-            label_color.setAlpha(190)
-            painter.setPen(label_color)
-            metrics = painter.fontMetrics()
+            painter.setFont(self._label_font)
+            painter.setPen(palette["range_label"])
+            metrics = self._label_metrics
             text_width = metrics.horizontalAdvance(range_label)
             x = int(plot_rect.right() - text_width)
             y = int(plot_rect.top() - 4 + metrics.ascent())
@@ -3092,27 +3507,19 @@ class TrendsGraphWidget(QWidget):
             if not points or (values and max(values) <= 0):
                 continue
             if len(points) > 1:
-                path = QPainterPath(points[0])
-                for idx in range(1, len(points)):
-                    path.lineTo(points[idx])
-
-                fill_path = QPainterPath(path)
-                fill_path.lineTo(points[-1].x(), plot_rect.bottom())
-                fill_path.lineTo(points[0].x(), plot_rect.bottom())
-                fill_path.closeSubpath()
-
-                gradient = QLinearGradient(
-                    0, plot_rect.top(), 0, plot_rect.bottom()
+                fill_polygon = QPolygonF(
+                    points
+                    + [
+                        QPointF(points[-1].x(), plot_rect.bottom()),
+                        QPointF(points[0].x(), plot_rect.bottom()),
+                    ]
                 )
-                fill_top = QColor(series.fill_color)
-                fill_bottom = QColor(series.fill_color)
-                fill_top.setAlpha(
-                    100 if series.label == self._active_label else 70
+                fill_path = QPainterPath()
+                fill_path.addPolygon(fill_polygon)
+                fill_path.closeSubpath()
+                painter.fillPath(
+                    fill_path, self._fill_gradient_for(series.label, plot_rect)
                 )
-                fill_bottom.setAlpha(0)
-                gradient.setColorAt(0, fill_top)
-                gradient.setColorAt(1, fill_bottom)
-                painter.fillPath(fill_path, gradient)
 
         for series in ordered_series:
             values = values_by_series.get(series.label, [])
@@ -3120,37 +3527,40 @@ class TrendsGraphWidget(QWidget):
             if not points or (values and max(values) <= 0):
                 continue
             if len(points) > 1:
-                pen_color = QColor(series.line_color)
-                pen_color.setAlpha(
-                    230 if series.label == self._active_label else 180
-                )
-                pen = QPen(
-                    pen_color,
-                    2.6 if series.label == self._active_label else 2.0,
-                )
-                pen.setCapStyle(Qt.RoundCap)
-                pen.setJoinStyle(Qt.RoundJoin)
-                painter.setPen(pen)
-                path = QPainterPath(points[0])
-                for idx in range(1, len(points)):
-                    path.lineTo(points[idx])
-                painter.drawPath(path)
+                painter.setPen(self._series_palette[series.label][2])
+                painter.setBrush(Qt.NoBrush)
+                painter.drawPolyline(QPolygonF(points))
 
         for series in ordered_series:
             values = values_by_series.get(series.label, [])
             points = self._points_by_series.get(series.label, [])
             if not points or (values and max(values) <= 0):
                 continue
-            dot_color = QColor(series.dot_color)
-            dot_color.setAlpha(
-                230 if series.label == self._active_label else 180
-            )
             painter.setPen(Qt.NoPen)
-            painter.setBrush(dot_color)
+            painter.setBrush(self._series_palette[series.label][3])
             dot_radius = self._dot_radius if series.label == self._active_label else 3
             for point in points:
                 painter.drawEllipse(point, dot_radius, dot_radius)
 
+        painter.setPen(palette["axis_label"])
+        label_y = self.rect().bottom() - 12
+        for x, y, text in self._axis_labels(painter, dates, label_y):
+            painter.drawText(x, y, text)
+
+    def _axis_labels(
+        self, painter: QPainter, dates: list[QDate], label_y: int
+    ) -> list[tuple[int, int, str]]:
+        key = (
+            self._scale,
+            dates[0].toJulianDay() if dates else 0,
+            len(dates),
+            self._plot_left,
+            self._step_x,
+            label_y,
+            painter.font().key(),
+        )
+        if self._label_cache_key == key:
+            return self._label_cache
         if self._scale == "year":
             labels = [date.toString("MMM") for date in dates]
             indices = self._label_indices(len(labels), True)
@@ -3160,37 +3570,37 @@ class TrendsGraphWidget(QWidget):
         else:
             labels = [date.toString("d") for date in dates]
             indices = self._label_indices(len(labels), False)
-
-        label_color = QColor(self._settings.text_color)
-        label_color.setAlpha(200)
-        painter.setPen(label_color)
         metrics = painter.fontMetrics()
-        label_y = self.rect().bottom() - 12
-        label_points = None
-        if self._active_label in self._points_by_series:
-            label_points = self._points_by_series[self._active_label]
-        elif self._points_by_series:
-            label_points = next(iter(self._points_by_series.values()))
+        cached: list[tuple[int, int, str]] = []
         for idx in indices:
-            if label_points is None or idx >= len(label_points):
-                continue
             text = labels[idx]
             text_width = metrics.horizontalAdvance(text)
-            x = label_points[idx].x() - (text_width / 2)
-            painter.drawText(int(x), int(label_y), text)
+            x = self._plot_left + (self._step_x * idx) - (text_width / 2)
+            cached.append((int(x), int(label_y), text))
+        self._label_cache_key = key
+        self._label_cache = cached
+        return cached
 
     def mouseMoveEvent(self, event) -> None:
         if not self._points_by_series:
             QToolTip.hideText()
             self._hover_index = None
             return
+        pos = event.position()
+        if self._step_x > 0:
+            center = int(round((pos.x() - self._plot_left) / self._step_x))
+        else:
+            center = 0
         closest_index = None
         closest_dist = None
         for points in self._points_by_series.values():
-            for idx, point in enumerate(points):
-                dist = (point.x() - event.position().x()) ** 2 + (
-                    point.y() - event.position().y()
-                ) ** 2
+            if not points:
+                continue
+            last = len(points) - 1
+            center_idx = max(0, min(last, center))
+            for idx in range(max(0, center_idx - 1), min(last, center_idx + 1) + 1):
+                point = points[idx]
+                dist = (point.x() - pos.x()) ** 2 + (point.y() - pos.y()) ** 2
                 if closest_dist is None or dist < closest_dist:
                     closest_dist = dist
                     closest_index = idx
@@ -3586,6 +3996,148 @@ class LogsCalendarWidget(QCalendarWidget):
             painter.restore()
 
 
+class ProfileLoadSignals(QObject):
+    loaded = Signal(int, object)
+
+
+class ProfileLoadTask(QRunnable):
+    def __init__(self, token: int, load: Callable[[], object]) -> None:
+        super().__init__()
+        self.token = token
+        self.signals = ProfileLoadSignals()
+        self._load = load
+
+    def run(self) -> None:
+        try:
+            result = self._load()
+        except Exception:
+            LOGGER.exception("Failed to load profile log")
+            result = None
+        self.signals.loaded.emit(self.token, result)
+
+
+class LogTableModel(QAbstractTableModel):
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._rows: list[dict[str, object]] = []
+        self._headers: list[str] = []
+        self._show_profile = False
+        self._goal_lookup: Callable[[str], int] = lambda _date_key: 0
+        self._color_lookup: Callable[[str], QColor] = lambda _label: QColor()
+        self._display_cache: dict[int, list[str]] = {}
+        self._goal_cache: dict[str, int] = {}
+        self._duration_cache: dict[int, str] = {}
+        self._percent_cache: dict[tuple[int, int], str] = {}
+        self._brush_cache: dict[str, QBrush] = {}
+
+    def set_rows(
+        self,
+        rows: list[dict[str, object]],
+        show_profile: bool,
+        goal_lookup: Callable[[str], int],
+        color_lookup: Callable[[str], QColor],
+    ) -> None:
+        self.beginResetModel()
+        self._rows = rows
+        self._show_profile = show_profile
+        if show_profile:
+            self._headers = ["Date", "Profile", "Started", "Paused", "Duration", "% Goal"]
+        else:
+            self._headers = ["Date", "Started", "Paused", "Duration", "% Goal"]
+        self._goal_lookup = goal_lookup
+        self._color_lookup = color_lookup
+        self._display_cache = {}
+        self._goal_cache = {}
+        self._percent_cache = {}
+        self._brush_cache = {}
+        self.endResetModel()
+
+    def row_for_date(self, date_key: str) -> int:
+        for row, entry in enumerate(self._rows):
+            if entry.get("date") == date_key:
+                return row
+        return -1
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def flags(self, index: QModelIndex):
+        return Qt.ItemIsEnabled
+
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole):
+        if (
+            role == Qt.DisplayRole
+            and orientation == Qt.Horizontal
+            and 0 <= section < len(self._headers)
+        ):
+            return self._headers[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._display_row(index.row())[index.column()]
+        if role == Qt.BackgroundRole and self._show_profile:
+            return self._row_brush(index.row())
+        return None
+
+    def _display_row(self, row: int) -> list[str]:
+        cached = self._display_cache.get(row)
+        if cached is not None:
+            return cached
+        entry = self._rows[row]
+        duration_seconds = int(entry["duration_seconds"])
+        duration = self._duration_cache.get(duration_seconds)
+        if duration is None:
+            duration = format_duration_hms(duration_seconds)
+            self._duration_cache[duration_seconds] = duration
+        entry_date_key = str(entry.get("date", ""))
+        if self._show_profile:
+            goal_seconds = int(entry.get("goal_seconds", 0) or 0)
+        else:
+            goal_seconds = self._goal_cache.get(entry_date_key, -1)
+            if goal_seconds < 0:
+                goal_seconds = self._goal_lookup(entry_date_key)
+                self._goal_cache[entry_date_key] = goal_seconds
+        percent_key = (duration_seconds, goal_seconds)
+        percent = self._percent_cache.get(percent_key)
+        if percent is None:
+            percent = format_percent(duration_seconds, goal_seconds)
+            self._percent_cache[percent_key] = percent
+        start_time = entry.get("start_time") or "N/A"
+        end_time = entry.get("end_time") or "N/A"
+        if self._show_profile:
+            values = [
+                entry["date"],
+                entry.get("profile_label", "Unknown"),
+                start_time,
+                end_time,
+                duration,
+                percent,
+            ]
+        else:
+            values = [entry["date"], start_time, end_time, duration, percent]
+        cached = [str(value) for value in values]
+        self._display_cache[row] = cached
+        return cached
+
+    def _row_brush(self, row: int) -> Optional[QBrush]:
+        label = self._rows[row].get("profile_label")
+        if not isinstance(label, str) or not label:
+            return None
+        brush = self._brush_cache.get(label)
+        if brush is None:
+            row_color = QColor(self._color_lookup(label))
+            row_color.setAlpha(40)
+            brush = QBrush(row_color)
+            self._brush_cache[label] = brush
+        return brush
+
+
 class LogsDialog(QDialog):
     def __init__(
         self,
@@ -3606,6 +4158,14 @@ class LogsDialog(QDialog):
         self._daily_goals = daily_goals
         self._fallback_goal_seconds = fallback_goal_seconds
         self._daily_totals = daily_totals
+        self._data_generation = 0
+        self._prefix_key: Optional[int] = None
+        self._week_total_key: Optional[tuple[str, str, int]] = None
+        self._entry_index_key: Optional[int] = None
+        self._entry_dates: list[str] = []
+        self._ordered_entries: list[dict[str, object]] = []
+        self._sorted_dates: list[str] = []
+        self._prefix_totals: list[int] = [0]
         self._settings = ui_settings
         self._current_profile = active_profile
         self._profile_labels = list(profile_labels)
@@ -3647,10 +4207,12 @@ class LogsDialog(QDialog):
         self.week_total_label = QLabel()
         self.week_total_label.setVisible(False)
 
-        self.table = QTableWidget(0, 5)
+        self.table_model = LogTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
         self.table.verticalHeader().setVisible(False)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.table.setSelectionMode(QTableWidget.NoSelection)
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
+        self.table.setSelectionMode(QTableView.NoSelection)
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.ResizeToContents)
         header.setStretchLastSection(True)
@@ -3710,7 +4272,7 @@ class LogsDialog(QDialog):
             entries, totals, _, _ = cached
             return entries, totals
         combined_entries: list[dict[str, object]] = []
-        combined_totals: dict[str, int] = {}
+        combined_totals: defaultdict[str, int] = defaultdict(int)
         for label in self._profile_labels:
             entries, totals, _, _ = self._load_profile_data(label)
             for entry in entries:
@@ -3718,7 +4280,7 @@ class LogsDialog(QDialog):
                 tagged["profile_label"] = label
                 combined_entries.append(tagged)
             for date_key, total in totals.items():
-                combined_totals[date_key] = combined_totals.get(date_key, 0) + total
+                combined_totals[date_key] += total
         cached = (combined_entries, combined_totals, {}, 0)
         self._profile_cache[LOGS_PROFILE_ALL] = cached
         return combined_entries, combined_totals
@@ -3748,22 +4310,28 @@ class LogsDialog(QDialog):
             return
         if data == LOGS_PROFILE_ALL:
             entries, totals = self._load_all_profile_data()
-            self._current_profile = data
-            self._entries = entries
-            self._daily_totals = totals
-            self._daily_goals = {}
-            self._fallback_goal_seconds = 0
+            self._set_profile_data(data, entries, totals, {}, 0)
         else:
-            entries, totals, goals, fallback_goal = self._load_profile_data(data)
-            self._current_profile = data
-            self._entries = entries
-            self._daily_totals = totals
-            self._daily_goals = goals
-            self._fallback_goal_seconds = fallback_goal
+            self._set_profile_data(data, *self._load_profile_data(data))
         if save:
             self._save_profile_selection()
         self._refresh_table()
 
+    def _set_profile_data(
+        self,
+        profile: str,
+        entries: list[dict[str, object]],
+        totals: dict[str, int],
+        goals: dict[str, int],
+        fallback_goal_seconds: int,
+    ) -> None:
+        self._current_profile = profile
+        self._entries = entries
+        self._daily_totals = totals
+        self._daily_goals = goals
+        self._fallback_goal_seconds = fallback_goal_seconds
+        self._data_generation += 1
+
     def _sync_selected_profile(self) -> None:
         data = self.profile_combo.currentData()
         if not isinstance(data, str):
@@ -3775,14 +4343,10 @@ class LogsDialog(QDialog):
         QTimer.singleShot(0, self._scroll_to_today)
 
     def _scroll_to_today(self) -> None:
-        if self.table.rowCount() <= 0:
-            return
-        today_key = QDate.currentDate().toString("yyyy-MM-dd")
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item is not None and item.text() == today_key:
-                self.table.scrollToItem(item)
-                return
+        today_key = qdate_to_key(QDate.currentDate())
+        row = self.table_model.row_for_date(today_key)
+        if row >= 0:
+            self.table.scrollTo(self.table_model.index(row, 0))
 
     def _on_profile_changed(self, index: int) -> None:
         if index < 0:
@@ -3797,20 +4361,44 @@ class LogsDialog(QDialog):
             return 0
         return self._daily_goals.get(date_key, self._fallback_goal_seconds)
 
+    def _range_total_seconds(self, start_key: str, end_key: str) -> int:
+        key = self._data_generation
+        if self._prefix_key != key:
+            self._sorted_dates = sorted(self._daily_totals)
+            prefix = [0]
+            running = 0
+            for date_key in self._sorted_dates:
+                running += self._daily_totals[date_key]
+                prefix.append(running)
+            self._prefix_totals = prefix
+            self._prefix_key = key
+        lo = bisect.bisect_left(self._sorted_dates, start_key)
+        hi = bisect.bisect_right(self._sorted_dates, end_key)
+        return self._prefix_totals[hi] - self._prefix_totals[lo]
+
+    def _entries_between(
+        self, start_key: str, end_key: str
+    ) -> list[dict[str, object]]:
+        key = self._data_generation
+        if self._entry_index_key != key:
+            ordered = sorted(
+                self._entries,
+                key=lambda entry: (
+                    str(entry.get("date", "")),
+                    str(entry.get("start_time", "") or ""),
+                ),
+            )
+            self._ordered_entries = ordered
+            self._entry_dates = [str(entry.get("date", "")) for entry in ordered]
+            self._entry_index_key = key
+        lo = bisect.bisect_left(self._entry_dates, start_key)
+        hi = bisect.bisect_right(self._entry_dates, end_key)
+        return self._ordered_entries[lo:hi]
+
     def _refresh_table(self) -> None:
         show_profile = self._current_profile == LOGS_PROFILE_ALL
-        if show_profile:
-            self.table.setColumnCount(6)
-            self.table.setHorizontalHeaderLabels(
-                ["Date", "Profile", "Started", "Paused", "Duration", "% Goal"]
-            )
-        else:
-            self.table.setColumnCount(5)
-            self.table.setHorizontalHeaderLabels(
-                ["Date", "Started", "Paused", "Duration", "% Goal"]
-            )
         selected_date = self.date_edit.date()
-        date_key = selected_date.toString("yyyy-MM-dd")
+        date_key = qdate_to_key(selected_date)
         if self._current_profile == LOGS_PROFILE_ALL:
             self.goal_label.setText("Daily super goal: varies by profile")
         else:
@@ -3825,70 +4413,28 @@ class LogsDialog(QDialog):
         if range_mode.startswith("week"):
             start_date = selected_date
             end_date = selected_date.addDays(6)
-            start_key = start_date.toString("yyyy-MM-dd")
-            end_key = end_date.toString("yyyy-MM-dd")
-            rows = [
-                entry
-                for entry in self._entries
-                if start_key <= str(entry.get("date", "")) <= end_key
-            ]
-            total_seconds = 0
-            date_cursor = start_date
-            while date_cursor <= end_date:
-                total_seconds += self._daily_totals.get(
-                    date_cursor.toString("yyyy-MM-dd"), 0
+            start_key = qdate_to_key(start_date)
+            end_key = qdate_to_key(end_date)
+            rows = self._entries_between(start_key, end_key)
+            total_seconds = self._range_total_seconds(start_key, end_key)
+            week_key = (start_key, end_key, total_seconds)
+            if week_key != self._week_total_key:
+                self._week_total_key = week_key
+                self.week_total_label.setText(
+                    f"Week total: {format_clock(total_seconds, pad_hours=False)}"
                 )
-                date_cursor = date_cursor.addDays(1)
-            hours = total_seconds // 3600
-            minutes = (total_seconds % 3600) // 60
-            seconds = total_seconds % 60
-            self.week_total_label.setText(
-                f"Week total: {hours}:{minutes:02d}:{seconds:02d}"
-            )
-            self.week_total_label.setToolTip(
-                f"{start_date.toString('yyyy-MM-dd')} to "
-                f"{end_date.toString('yyyy-MM-dd')}"
-            )
+                self.week_total_label.setToolTip(f"{start_key} to {end_key}")
             self.week_total_label.setVisible(True)
         else:
-            rows = [entry for entry in self._entries if entry["date"] == date_key]
+            rows = self._entries_between(date_key, date_key)
             self.week_total_label.setVisible(False)
-        rows.sort(key=lambda entry: (entry.get("date", ""), entry.get("start_time", "")))
-        self.table.setRowCount(len(rows))
-        for row_idx, entry in enumerate(rows):
-            duration_seconds = int(entry["duration_seconds"])
-            duration = format_duration_hms(duration_seconds)
-            entry_date_key = str(entry.get("date", ""))
-            if self._current_profile == LOGS_PROFILE_ALL:
-                entry_goal_seconds = int(entry.get("goal_seconds", 0) or 0)
-            else:
-                entry_goal_seconds = self._goal_seconds_for_date(entry_date_key)
-            percent = format_percent(duration_seconds, entry_goal_seconds)
-            start_time = entry.get("start_time") or "N/A"
-            end_time = entry.get("end_time") or "N/A"
-            if show_profile:
-                values = [
-                    entry["date"],
-                    entry.get("profile_label", "Unknown"),
-                    start_time,
-                    end_time,
-                    duration,
-                    percent,
-                ]
-            else:
-                values = [entry["date"], start_time, end_time, duration, percent]
-            row_color = None
-            if show_profile:
-                label = entry.get("profile_label")
-                if isinstance(label, str) and label:
-                    row_color = QColor(self._parent._profile_color(label))
-                    row_color.setAlpha(40)
-            for col, value in enumerate(values):
-                item = QTableWidgetItem(str(value))
-                item.setFlags(Qt.ItemIsEnabled)
-                if row_color is not None:
-                    item.setBackground(QBrush(row_color))
-                self.table.setItem(row_idx, col, item)
+        self.table_model.set_rows(
+            rows,
+            show_profile,
+            self._goal_seconds_for_date,
+            self._parent._profile_color,
+        )
+
 
 class CountdownWindow(QMainWindow):
     def __init__(self) -> None:
@@ -3903,9 +4449,12 @@ class CountdownWindow(QMainWindow):
         init_paths()
         self._data_dir = DATA_DIR or resolve_data_dir()
         self.settings = self._load_settings()
+        self._last_saved_settings: dict[str, object] = {}
         self.hotkey_settings = self._load_hotkey_settings()
         self._default_profile_files = {label: fname for label, fname in DEFAULT_PROFILES}
         self._custom_profiles = self._load_custom_profiles()
+        self._profile_label_keys: set[str] = set()
+        self._sync_profile_label_keys()
         self._active_profile = self._load_active_profile()
         self._profile_colors = self._load_profile_colors()
         self.super_goal_seconds = self._load_profile_super_goal_seconds(
@@ -3918,8 +4467,41 @@ class CountdownWindow(QMainWindow):
             self.daily_totals,
             self.daily_goals,
         ) = self._load_log_entries()
+        self._year_day_totals_key: Optional[tuple[int, int]] = None
+        self._year_day_totals = array.array("q")
+        self._year_totals_source: Optional[int] = None
+        self._year_totals: dict[int, int] = {}
+        self._totals_by_year: dict[int, dict[str, int]] = {}
+        self._data_generation = 0
+        self._week_total_key: Optional[tuple] = None
+        self._week_total: tuple[str, str, int] = ("", "", 0)
+        self._streak_cache_key: Optional[tuple] = None
+        self._streak_cache = (0, 0)
+        self._style_cache_key: Optional[tuple] = None
+        self._style_cache: dict[str, str] = {}
+        self._heatmap_sheet_key: Optional[tuple[int, int]] = None
+        self._last_qss: dict[int, str] = {}
+        self._last_label_text: dict[int, str] = {}
+        self._coarse_tick_count = 0
+        self._day_bounds_key: Optional[tuple] = None
+        self._day_bounds: Optional[tuple[QDateTime, QDateTime]] = None
+        self._year_total_text_key: Optional[tuple[str, int]] = None
+        self._year_total_state: Optional[tuple] = None
         self._last_added_time_entry = None
         self._last_added_time_index = None
+        self._last_added_time_file: Optional[tuple[str, int, int]] = None
+        self._log_handle = None
+        self._log_writer = None
+        self._log_handle_path: Optional[str] = None
+        self._profile_load_token = 0
+        self._profile_loading = False
+        self._profile_load_failed = False
+        self._profile_load_signals: Optional[ProfileLoadSignals] = None
+        self._profile_cache: dict[
+            str,
+            tuple[list[dict[str, object]], dict[str, int], dict[str, int], tuple],
+        ] = {}
+        self._remember_profile_data()
         self._active_session_start = None
         self._active_session_seconds = 0
         self._active_session_date_key = None
@@ -3929,6 +4511,7 @@ class CountdownWindow(QMainWindow):
         self.clock_elapsed_seconds = 0
         self._clock_offset_seconds = 0
         self._acrylic_enabled = sys.platform == "win32"
+        self._acrylic_state: Optional[tuple[int, int, float]] = None
         self._is_macos = sys.platform == "darwin"
         self._mac_blur_supported = self._is_macos and QMacVisualEffect is not None
         self._blur_supported = (
@@ -3948,12 +4531,14 @@ class CountdownWindow(QMainWindow):
         self._heatmap_label_spacing = self._heatmap_label_spacing_base
         self._heatmap_spacing = 2
         self._heatmap_year = QDate.currentDate().year()
+        self._heatmap_dirty = True
+        self._heatmap_refresh_pending = False
         self._always_on_top = self.settings.always_on_top
         self._scale_factor = 1.0
         self._year_total_anim = None
         self._start_shortcut = None
         self._clock_shortcut = None
-        self._xinput_reader = GamepadReader()
+        self._xinput_reader: Optional[GamepadReader] = None
         self._xinput_timer = QTimer(self)
         self._xinput_timer.setInterval(50)
         self._xinput_timer.timeout.connect(self._poll_xinput)
@@ -3963,20 +4548,49 @@ class CountdownWindow(QMainWindow):
         self._deletion_history: list[tuple[str, dict[str, object]]] = []
 
         self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.CoarseTimer)
         self.timer.setInterval(1000)
         self.timer.timeout.connect(self._tick)
 
         self.day_time_timer = QTimer(self)
-        self.day_time_timer.setInterval(1000)
-        self.day_time_timer.timeout.connect(self._update_day_time_label)
-        self.day_time_timer.start()
-
-        self._build_ui()
-        self._apply_window_flag_defaults()
+        self.day_time_timer.setSingleShot(True)
+        self.day_time_timer.setTimerType(Qt.PreciseTimer)
+        self.day_time_timer.timeout.connect(self._day_time_tick)
+        self._schedule_day_time_tick()
+
+        self._heatmap_dirty_dates: set[str] = set()
+        self._heatmap_refresh_timer = QTimer(self)
+        self._heatmap_refresh_timer.setSingleShot(True)
+        self._heatmap_refresh_timer.setTimerType(Qt.CoarseTimer)
+        self._heatmap_refresh_timer.setInterval(50)
+        self._heatmap_refresh_timer.timeout.connect(self._flush_heatmap_updates)
+        self._scale_timer = QTimer(self)
+        self._scale_timer.setSingleShot(True)
+        self._scale_timer.setTimerType(Qt.CoarseTimer)
+        self._scale_timer.setInterval(150)
+        self._scale_timer.timeout.connect(self._apply_scaled_metrics)
+        self._pending_heatmap_steps = 0
+        self._heatmap_wheel_timer = QTimer(self)
+        self._heatmap_wheel_timer.setSingleShot(True)
+        self._heatmap_wheel_timer.setTimerType(Qt.CoarseTimer)
+        self._heatmap_wheel_timer.setInterval(100)
+        self._heatmap_wheel_timer.timeout.connect(self._apply_heatmap_wheel)
         self._window_save_timer = QTimer(self)
         self._window_save_timer.setSingleShot(True)
+        self._window_save_timer.setTimerType(Qt.CoarseTimer)
         self._window_save_timer.setInterval(250)
         self._window_save_timer.timeout.connect(self._save_window_geometry)
+        self._last_saved_geometry: Optional[tuple[int, int, int, int]] = None
+        self._scaled_metrics_key: Optional[tuple] = None
+        self._month_label_style_key: Optional[tuple] = None
+
+        self._context_menu: Optional[QMenu] = None
+        self._act_undo_add: Optional[QAction] = None
+        self._act_always_on_top: Optional[QAction] = None
+        self._visibility_actions: dict[str, QAction] = {}
+
+        self._build_ui()
+        self._apply_window_flag_defaults()
         self._connected_screens = set()
         self._restore_window_geometry()
         self._ensure_window_visible()
@@ -4135,15 +4749,29 @@ class CountdownWindow(QMainWindow):
         self.central.setLayout(self.stack_layout)
 
     def _show_context_menu(self, pos) -> None:
-        menu = self._build_context_menu()
-        menu.exec(self.mapToGlobal(pos))
+        if self._context_menu is None:
+            self._context_menu = self._build_context_menu()
+        self._sync_context_menu()
+        self._context_menu.exec(self.mapToGlobal(pos))
+
+    def _sync_context_menu(self) -> None:
+        self._act_undo_add.setEnabled(self._last_added_time_entry is not None)
+        checked_states = [(self._act_always_on_top, self._always_on_top)]
+        for setting_key, action in self._visibility_actions.items():
+            checked_states.append((action, getattr(self.settings, setting_key)))
+        for action, checked in checked_states:
+            if action.isChecked() == checked:
+                continue
+            action.blockSignals(True)
+            action.setChecked(checked)
+            action.blockSignals(False)
 
-    def _build_context_menu(self):
+    def _build_context_menu(self) -> QMenu:
         menu = QMenu(self)
         set_time = QAction("Set Current Goal", self)
         add_time = QAction("Add to time", self)
         undo_add_time = QAction("Undo added time", self)
-        undo_add_time.setEnabled(self._last_added_time_entry is not None)
+        self._act_undo_add = undo_add_time
         set_super_goal = QAction("Set Daily Super Goal", self)
         logs = QAction("Logs", self)
         calendar_view = QAction("Calendar View", self)
@@ -4152,6 +4780,7 @@ class CountdownWindow(QMainWindow):
         always_on_top = QAction("Always On Top", self)
         always_on_top.setCheckable(True)
         always_on_top.setChecked(self._always_on_top)
+        self._act_always_on_top = always_on_top
         reset_clock = QAction("Clock reset", self)
         reset_time = QAction("Reset Timer", self)
         settings = QAction("Settings", self)
@@ -4252,6 +4881,8 @@ class CountdownWindow(QMainWindow):
         self.status_label.setText("Goal time set")
 
     def _open_add_time(self) -> None:
+        if self._profile_busy():
+            return
         dialog = AddTimeDialog(self, use_24h_time=self.settings.use_24h_time)
         if dialog.exec() != QDialog.Accepted:
             return
@@ -4268,9 +4899,16 @@ class CountdownWindow(QMainWindow):
         end_time_str = start_time.addSecs(duration).toString("HH:mm:ss")
         goal_seconds = self._goal_seconds_for_date(date_key)
         self.daily_goals[date_key] = goal_seconds
+        self._ensure_data_file()
+        size_before = os.path.getsize(self._data_file_path)
         self._append_log_entry(
             date_key, start_time_str, end_time_str, duration, goal_seconds
         )
+        self._last_added_time_file = (
+            self._data_file_path,
+            size_before,
+            os.path.getsize(self._data_file_path),
+        )
         entry = {
             "date": date_key,
             "start_time": start_time_str,
@@ -4281,14 +4919,16 @@ class CountdownWindow(QMainWindow):
         self.log_entries.append(entry)
         self._last_added_time_entry = entry
         self._last_added_time_index = len(self.log_entries) - 1
-        self.daily_totals[date_key] = self.daily_totals.get(date_key, 0) + duration
+        self._add_day_seconds(date_key, duration)
         if QDate.currentDate().year() != self._heatmap_year:
             self._refresh_heatmap()
-        self._update_heatmap_cell(date_key)
+        self._schedule_heatmap_cell(date_key)
         self._update_total_today_label()
         self.status_label.setText("Added time to today")
 
     def _undo_added_time(self) -> None:
+        if self._profile_busy():
+            return
         if self._last_added_time_entry is None or self._last_added_time_index is None:
             self.status_label.setText("No added time to undo")
             return
@@ -4296,20 +4936,20 @@ class CountdownWindow(QMainWindow):
         index = self._last_added_time_index
         removed = False
         if 0 <= index < len(self.log_entries) and self.log_entries[index] is entry:
-            self.log_entries.pop(index)
+            del self.log_entries[index]
             removed = True
         else:
-            for i, existing in enumerate(self.log_entries):
+            match = None
+            for i in range(len(self.log_entries) - 1, -1, -1):
+                existing = self.log_entries[i]
                 if existing is entry:
-                    self.log_entries.pop(i)
-                    removed = True
+                    match = i
                     break
-            if not removed:
-                for i, existing in enumerate(self.log_entries):
-                    if existing == entry:
-                        self.log_entries.pop(i)
-                        removed = True
-                        break
+                if match is None and existing == entry:
+                    match = i
+            if match is not None:
+                del self.log_entries[match]
+                removed = True
         self._last_added_time_entry = None
         self._last_added_time_index = None
         if not removed:
@@ -4321,17 +4961,33 @@ class CountdownWindow(QMainWindow):
         except (TypeError, ValueError):
             duration = 0
         if date_key:
-            updated = max(0, self.daily_totals.get(date_key, 0) - duration)
-            if updated <= 0:
-                self.daily_totals.pop(date_key, None)
-            else:
-                self.daily_totals[date_key] = updated
-            self._update_heatmap_cell(date_key)
-        self._rewrite_log_file(self.log_entries, self.daily_goals)
+            self._add_day_seconds(date_key, -duration)
+            self._schedule_heatmap_cell(date_key)
+        if not self._truncate_added_time():
+            self._rewrite_log_file(self.log_entries, self.daily_goals)
         self._update_total_today_label()
         self.status_label.setText("Undid added time")
 
+    def _truncate_added_time(self) -> bool:
+        marker = self._last_added_time_file
+        self._last_added_time_file = None
+        if marker is None:
+            return False
+        path, size_before, size_after = marker
+        if path != self._data_file_path:
+            return False
+        try:
+            # Only safe when nothing else has been appended since the add.
+            if os.path.getsize(path) != size_after:
+                return False
+            os.truncate(path, size_before)
+        except OSError:
+            return False
+        return True
+
     def _open_set_super_goal(self) -> None:
+        if self._profile_busy():
+            return
         hours, minutes = self._seconds_to_hm(self.super_goal_seconds)
         dialog = SetTimeDialog(
             self, hours, minutes, title="Set Daily Super Goal"
@@ -4343,11 +4999,12 @@ class CountdownWindow(QMainWindow):
         self.super_goal_seconds = hours * 3600 + minutes * 60
         self._save_super_goal()
         self._set_daily_goal(QDate.currentDate(), self.super_goal_seconds, True)
-        self._refresh_heatmap()
         self._update_goal_left_label()
         self.status_label.setText("Daily super goal set")
 
     def _open_logs(self) -> None:
+        if self._profile_busy():
+            return
         dialog = LogsDialog(
             self,
             self.log_entries,
@@ -4361,11 +5018,15 @@ class CountdownWindow(QMainWindow):
         dialog.exec()
 
     def _open_calendar_view(self) -> None:
+        if self._profile_busy():
+            return
         dialog = CalendarViewDialog(self, self.settings)
         dialog.exec()
 
     def _delete_log_entry(self, profile_label: str, entry: dict[str, object]) -> None:
         """Removes a log entry from the specified profile and persists changes."""
+        if self._profile_busy():
+            return
         path = self._profile_file_path(profile_label)
         fallback_goal = self._load_profile_super_goal_seconds(profile_label)
         entries, _, goals = self._load_log_entries_from_path(
@@ -4399,19 +5060,15 @@ class CountdownWindow(QMainWindow):
         
         # If it's the active profile, reload everything to sync main UI
         if profile_label == self._active_profile:
-            (
-                self.log_entries,
-                self.daily_totals,
-                self.daily_goals,
-            ) = self._load_log_entries()
-            self._refresh_heatmap()
-            self._update_total_today_label()
+            self._replace_log_data(*self._load_log_entries())
             self.status_label.setText(f"Deleted block from {profile_label}")
         else:
             self.status_label.setText(f"Deleted block from {profile_label}")
 
     def _undo_delete_log_entry(self) -> None:
         """Restores the last deleted block from history."""
+        if self._profile_busy():
+            return
         if not self._deletion_history:
             self.status_label.setText("No deleted blocks to undo")
             return
@@ -4433,13 +5090,7 @@ class CountdownWindow(QMainWindow):
             
         # If it's the active profile, reload main UI
         if profile_label == self._active_profile:
-            (
-                self.log_entries,
-                self.daily_totals,
-                self.daily_goals,
-            ) = self._load_log_entries()
-            self._refresh_heatmap()
-            self._update_total_today_label()
+            self._replace_log_data(*self._load_log_entries())
             
         self.status_label.setText(f"Restored deleted block to {profile_label}")
 
@@ -4452,6 +5103,8 @@ class CountdownWindow(QMainWindow):
         label: str,
     ) -> None:
         """Manually adds a log entry to a profile's CSV."""
+        if self._profile_busy():
+            return
         date_key = self._date_key(date)
         start_str = start_time.toString("HH:mm:ss")
         end_time = start_time.addSecs(duration_seconds)
@@ -4465,13 +5118,7 @@ class CountdownWindow(QMainWindow):
             writer.writerow([date_key, start_str, end_str, duration_seconds, goal_seconds, label])
 
         if profile_label == self._active_profile:
-            (
-                self.log_entries,
-                self.daily_totals,
-                self.daily_goals,
-            ) = self._load_log_entries()
-            self._refresh_heatmap()
-            self._update_total_today_label()
+            self._replace_log_data(*self._load_log_entries())
 
         self.status_label.setText(f"Added manual entry to {profile_label}")
 
@@ -4523,7 +5170,7 @@ class CountdownWindow(QMainWindow):
             return
         for label, color in changed.items():
             fallback = self._profile_fallback_color(label)
-            if qcolor_to_hex(color) == qcolor_to_hex(fallback):
+            if color.rgb() == fallback.rgb():
                 self._clear_profile_color(label)
             else:
                 self._set_profile_color(label, color)
@@ -4539,11 +5186,12 @@ class CountdownWindow(QMainWindow):
         self._save_settings()
 
     def _open_hotkey_settings(self) -> None:
+        reader = self._gamepad_reader()
         dialog = HotkeySettingsDialog(
             self,
             HotkeySettings(**self.hotkey_settings.__dict__),
-            self._xinput_reader.available,
-            self._xinput_reader.group_label,
+            reader.available,
+            reader.group_label,
         )
         if dialog.exec() != QDialog.Accepted:
             return
@@ -4589,9 +5237,8 @@ class CountdownWindow(QMainWindow):
             self.hotkey_settings.clock_xinput_button, 0
         )
         if (
-            self._xinput_reader.available
-            and (self._xinput_start_mask or self._xinput_clock_mask)
-        ):
+            self._xinput_start_mask or self._xinput_clock_mask
+        ) and self._gamepad_reader().available:
             if not self._xinput_timer.isActive():
                 self._xinput_prev_buttons = 0
                 self._xinput_timer.start()
@@ -4618,8 +5265,13 @@ class CountdownWindow(QMainWindow):
         shortcut.setEnabled(True)
         return shortcut
 
+    def _gamepad_reader(self) -> GamepadReader:
+        if self._xinput_reader is None:
+            self._xinput_reader = GamepadReader()
+        return self._xinput_reader
+
     def _poll_xinput(self) -> None:
-        buttons = self._xinput_reader.read_buttons()
+        buttons = self._gamepad_reader().read_buttons()
         if buttons is None:
             self._xinput_prev_buttons = 0
             return
@@ -4636,9 +5288,7 @@ class CountdownWindow(QMainWindow):
             self.setWindowOpacity(1.0)
             if self.blur_effect is not None:
                 self.blur_effect.setBlurRadius(0)
-            apply_windows_acrylic(
-                int(self.winId()), self.settings.bg_color, self.settings.opacity
-            )
+            self._apply_acrylic()
         elif self._is_macos:
             self.setWindowOpacity(1.0)
             if self.blur_effect is not None:
@@ -4650,49 +5300,25 @@ class CountdownWindow(QMainWindow):
             if self.blur_effect is not None:
                 self.blur_effect.setBlurRadius(blur_radius)
 
-        self.timer_label.setStyleSheet(
-            f"color: {qcolor_to_hex(self.settings.text_color)};"
-        )
-        self.status_label.setStyleSheet(
-            f"color: {qcolor_to_hex(self.settings.accent_color)};"
-        )
-        self.day_time_label.setStyleSheet(
-            f"color: {qcolor_to_hex(self.settings.day_time_color)};"
-        )
-        self.total_today_label.setStyleSheet(
-            f"color: {qcolor_to_hex(self.settings.total_today_color)};"
-        )
-        self.profile_label.setStyleSheet(
-            f"color: {qcolor_to_hex(self.settings.total_today_color)};"
-        )
-        self.goal_left_label.setStyleSheet(
-            f"color: {qcolor_to_hex(self.settings.goal_left_color)};"
-        )
-        self.year_total_label.setStyleSheet(
-            f"color: {qcolor_to_hex(self.settings.total_today_color)};"
-        )
+        styles = self._main_style_sheets()
+        self._set_style(self.timer_label, styles["timer"])
+        self._set_style(self.status_label, styles["status"])
+        self._set_style(self.day_time_label, styles["day_time"])
+        self._set_style(self.total_today_label, styles["total_today"])
+        self._set_style(self.profile_label, styles["total_today"])
+        self._set_style(self.goal_left_label, styles["goal_left"])
+        self._set_style(self.year_total_label, styles["total_today"])
         self.super_goal_bar.set_colors(
             self.settings.super_goal_bar_start,
             self.settings.super_goal_bar_end,
             self.settings.super_goal_bar_bg,
         )
-        self.longest_streak_label.setStyleSheet(
-            f"color: {qcolor_to_hex(self.settings.total_today_color)};"
-        )
-        self.current_streak_label.setStyleSheet(
-            f"color: {qcolor_to_hex(self.settings.total_today_color)};"
-        )
+        self._set_style(self.longest_streak_label, styles["total_today"])
+        self._set_style(self.current_streak_label, styles["total_today"])
         self._goal_pulse_anim.setDuration(
             max(200, int(self.settings.goal_pulse_seconds * 1000))
         )
-        self.setStyleSheet(
-            "QToolTip {"
-            f"background-color: {qcolor_to_hex(self.settings.heatmap_hover_bg_color)};"
-            f"color: {qcolor_to_hex(self.settings.heatmap_hover_text_color)};"
-            f"border: 1px solid {qcolor_to_hex(self.settings.heatmap_hover_text_color)};"
-            "padding: 4px;"
-            "}"
-        )
+        self._set_style(self, styles["tooltip"])
         self.toggle_btn.set_colors(
             self.settings.accent_color, self.settings.text_color
         )
@@ -4704,17 +5330,49 @@ class CountdownWindow(QMainWindow):
         self._heatmap_base_size = self.settings.heatmap_cell_size
         self._heatmap_month_padding_base = self.settings.heatmap_month_padding
         self._heatmap_month_label_size_base = self.settings.heatmap_month_label_size
-        resized = self._apply_scaled_metrics()
-        if not resized:
-            self._refresh_heatmap()
-        self._update_day_time_label()
-        self._update_total_today_label()
-        self._update_goal_left_label()
+        # Colors may have changed; a geometry rebuild repaints and clears this.
+        self._heatmap_dirty = True
+        self._apply_scaled_metrics()
+        self._recompute_ui_state(heatmap=True, day_time=True)
         self._apply_visibility_settings()
 
+        self._set_style(self.background, styles["background"])
+
+    def _set_style(self, widget: QWidget, style: str) -> None:
+        key = id(widget)
+        if self._last_qss.get(key) == style:
+            return
+        self._last_qss[key] = style
+        widget.setStyleSheet(style)
+
+    def _set_label(self, label: QLabel, text: str) -> None:
+        key = id(label)
+        if self._last_label_text.get(key) == text:
+            return
+        self._last_label_text[key] = text
+        label.setText(text)
+
+    def _main_style_sheets(self) -> dict[str, str]:
+        settings = self.settings
+        key = (
+            settings.text_color.rgb(),
+            settings.accent_color.rgb(),
+            settings.day_time_color.rgb(),
+            settings.total_today_color.rgb(),
+            settings.goal_left_color.rgb(),
+            settings.heatmap_hover_bg_color.rgb(),
+            settings.heatmap_hover_text_color.rgb(),
+            settings.bg_color.rgba(),
+            settings.opacity,
+            self._acrylic_enabled,
+            self._is_macos,
+        )
+        if self._style_cache_key == key:
+            return self._style_cache
+        hover_text = qcolor_to_hex(settings.heatmap_hover_text_color)
         if self._acrylic_enabled:
-            border_color = self.settings.text_color
-            self.background.setStyleSheet(
+            border_color = settings.text_color
+            background = (
                 "#backgroundFrame {"
                 "background-color: rgba(0, 0, 0, 0);"
                 "border-radius: 18px;"
@@ -4724,49 +5382,86 @@ class CountdownWindow(QMainWindow):
             )
         else:
             if self._is_macos:
-                bg = qcolor_to_rgba(self.settings.bg_color, self.settings.opacity)
+                bg = qcolor_to_rgba(settings.bg_color, settings.opacity)
             else:
-                bg = qcolor_to_hex(self.settings.bg_color)
-            self.background.setStyleSheet(
+                bg = qcolor_to_hex(settings.bg_color)
+            background = (
                 "#backgroundFrame {"
                 f"background-color: {bg};"
                 "border-radius: 18px;"
                 "}"
             )
+        self._style_cache = {
+            "timer": f"color: {qcolor_to_hex(settings.text_color)};",
+            "status": f"color: {qcolor_to_hex(settings.accent_color)};",
+            "day_time": f"color: {qcolor_to_hex(settings.day_time_color)};",
+            "total_today": f"color: {qcolor_to_hex(settings.total_today_color)};",
+            "goal_left": f"color: {qcolor_to_hex(settings.goal_left_color)};",
+            "tooltip": (
+                "QToolTip {"
+                f"background-color: {qcolor_to_hex(settings.heatmap_hover_bg_color)};"
+                f"color: {hover_text};"
+                f"border: 1px solid {hover_text};"
+                "padding: 4px;"
+                "}"
+            ),
+            "background": background,
+        }
+        self._style_cache_key = key
+        return self._style_cache
 
     def _apply_scaled_metrics(self) -> bool:
         self._update_scale_factor()
         scale = self._scale_factor
+        metrics_key = (
+            scale,
+            self._font_family,
+            self.settings.font_size,
+            self.settings.label_size,
+            self.settings.day_time_font_size,
+            self.settings.total_today_font_size,
+            self.settings.goal_left_font_size,
+            self.settings.super_goal_bar_width,
+            self.settings.super_goal_bar_height,
+            self.settings.day_time_color.rgb(),
+            self._heatmap_base_size,
+            self._heatmap_month_padding_base,
+            self._heatmap_month_label_size_base,
+            self._heatmap_label_spacing_base,
+        )
+        if metrics_key == self._scaled_metrics_key:
+            return False
+        self._scaled_metrics_key = metrics_key
         timer_size = max(10, int(self.settings.font_size * scale))
         label_size = max(8, int(self.settings.label_size * scale))
         day_time_size = max(8, int(self.settings.day_time_font_size * scale))
         total_today_size = max(8, int(self.settings.total_today_font_size * scale))
         goal_left_size = max(8, int(self.settings.goal_left_font_size * scale))
         self.timer_label.setFont(
-            QFont(self._font_family, timer_size, QFont.Bold)
+            cached_font(self._font_family, timer_size, bold=True)
         )
-        self.status_label.setFont(QFont(self._font_family, label_size))
-        self.day_time_label.setFont(QFont(self._font_family, day_time_size))
+        self.status_label.setFont(cached_font(self._font_family, label_size))
+        self.day_time_label.setFont(cached_font(self._font_family, day_time_size))
         self.total_today_label.setFont(
-            QFont(self._font_family, total_today_size)
+            cached_font(self._font_family, total_today_size)
         )
-        self.profile_label.setFont(QFont(self._font_family, label_size))
-        self.profile_combo.setFont(QFont(self._font_family, label_size))
+        self.profile_label.setFont(cached_font(self._font_family, label_size))
+        self.profile_combo.setFont(cached_font(self._font_family, label_size))
         self.profile_combo.setMinimumWidth(max(150, int(180 * scale)))
         self.goal_left_label.setFont(
-            QFont(self._font_family, goal_left_size)
+            cached_font(self._font_family, goal_left_size)
         )
         self.year_total_label.setFont(
-            QFont(self._font_family, goal_left_size)
+            cached_font(self._font_family, goal_left_size)
         )
         bar_width = max(20, int(self.settings.super_goal_bar_width * scale))
         bar_height = max(4, int(self.settings.super_goal_bar_height * scale))
         self.super_goal_bar.set_bar_size(bar_width, bar_height)
         self.longest_streak_label.setFont(
-            QFont(self._font_family, label_size)
+            cached_font(self._font_family, label_size)
         )
         self.current_streak_label.setFont(
-            QFont(self._font_family, label_size)
+            cached_font(self._font_family, label_size)
         )
         self.toggle_btn.set_scale(scale)
         self.clock_btn.set_scale(scale)
@@ -4851,14 +5546,21 @@ class CountdownWindow(QMainWindow):
         )
         return self._apply_heatmap_geometry(scaled_size, scaled_padding)
 
+    def _apply_month_label_style(self) -> None:
+        color = qcolor_to_hex(self.settings.day_time_color)
+        style_key = (self._font_family, self._heatmap_month_label_size, color)
+        if style_key == self._month_label_style_key:
+            return
+        self._month_label_style_key = style_key
+        self.month_labels_widget.setFont(
+            cached_font(self._font_family, self._heatmap_month_label_size)
+        )
+        self.month_labels_widget.setStyleSheet(f"QLabel {{ color: {color}; }}")
+
     def _update_month_label_style(self) -> None:
         if not hasattr(self, "month_label_widgets"):
             return
-        font = QFont(self._font_family, self._heatmap_month_label_size)
-        color = qcolor_to_hex(self.settings.day_time_color)
-        for label in self.month_label_widgets:
-            label.setFont(font)
-            label.setStyleSheet(f"color: {color};")
+        self._apply_month_label_style()
         if getattr(self, "month_labels_widget", None) is not None:
             self.month_labels_widget.setFixedHeight(
                 self._heatmap_label_height
@@ -4875,6 +5577,8 @@ class CountdownWindow(QMainWindow):
             self.heatmap_widget.setFixedHeight(total_height)
 
     def _toggle_timer(self) -> None:
+        if self._profile_busy():
+            return
         if self.clock_active:
             self._stop_clock("Clock off")
         if self.timer_active:
@@ -4892,6 +5596,8 @@ class CountdownWindow(QMainWindow):
         self.status_label.setText("Counting down")
 
     def _toggle_clock(self) -> None:
+        if self._profile_busy():
+            return
         if self.clock_active:
             self._stop_clock("Clock off")
             return
@@ -4955,11 +5661,7 @@ class CountdownWindow(QMainWindow):
     def _update_timer_label(self, total_seconds: Optional[int] = None) -> None:
         if total_seconds is None:
             total_seconds = self.remaining_seconds
-        total_seconds = max(0, int(total_seconds))
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
-        self.timer_label.setText(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
+        self._set_label(self.timer_label, format_clock(max(0, int(total_seconds))))
 
     def _handle_time_up(self) -> None:
         self.timer.stop()
@@ -5004,48 +5706,71 @@ class CountdownWindow(QMainWindow):
 
     def _update_day_time_label(self) -> None:
         now = QDateTime.currentDateTime()
-        start_time = QTime(self.settings.day_start_hour, self.settings.day_start_minute)
-        end_time = QTime(self.settings.day_end_hour, self.settings.day_end_minute)
-        start_dt = QDateTime(now.date(), start_time)
-        end_dt = QDateTime(now.date(), end_time)
-        if not end_dt.isValid() or not start_dt.isValid() or end_dt <= start_dt:
-            remaining_seconds = 0
-        elif now < start_dt or now >= end_dt:
+        today = now.date()
+        settings = self.settings
+        bounds_key = (
+            today.toJulianDay(),
+            settings.day_start_hour,
+            settings.day_start_minute,
+            settings.day_end_hour,
+            settings.day_end_minute,
+        )
+        if bounds_key != self._day_bounds_key:
+            start_dt = QDateTime(
+                today, QTime(settings.day_start_hour, settings.day_start_minute)
+            )
+            end_dt = QDateTime(
+                today, QTime(settings.day_end_hour, settings.day_end_minute)
+            )
+            if not end_dt.isValid() or not start_dt.isValid() or end_dt <= start_dt:
+                self._day_bounds = None
+            else:
+                self._day_bounds = (start_dt, end_dt)
+            self._day_bounds_key = bounds_key
+        bounds = self._day_bounds
+        if bounds is None or now < bounds[0] or now >= bounds[1]:
             remaining_seconds = 0
         else:
-            remaining_seconds = max(0, int(now.secsTo(end_dt)))
-        hours = remaining_seconds // 3600
-        minutes = (remaining_seconds % 3600) // 60
-        seconds = remaining_seconds % 60
-        self.day_time_label.setText(
-            f"Day time left: {hours:02d}:{minutes:02d}:{seconds:02d}"
+            remaining_seconds = max(0, int(now.secsTo(bounds[1])))
+        self._set_label(
+            self.day_time_label, f"Day time left: {format_clock(remaining_seconds)}"
         )
 
-    def _update_total_today_label(self) -> None:
+    def _recompute_ui_state(
+        self, *, heatmap: bool = False, day_time: bool = False, streaks: bool = True
+    ) -> None:
+        if heatmap:
+            self._request_heatmap_refresh()
+        if day_time:
+            self._update_day_time_label()
         date_key = self._date_key(QDate.currentDate())
         total_seconds = self._total_seconds_for_day(date_key)
-        self.total_today_label.setText(
-            f"Total today: {total_seconds // 3600:02d}:"
-            f"{(total_seconds % 3600) // 60:02d}:"
-            f"{total_seconds % 60:02d}"
+        self._set_label(
+            self.total_today_label, f"Total today: {format_clock(total_seconds)}"
         )
-        self._update_goal_left_label()
+        self._update_goal_left_label(date_key, total_seconds)
         self._update_year_total_label()
-        self._update_streak_labels()
+        if streaks:
+            self._update_streak_labels()
 
-    def _update_goal_left_label(self) -> None:
-        date_key = self._date_key(QDate.currentDate())
+    def _update_total_today_label(self) -> None:
+        self._recompute_ui_state()
+
+    def _update_goal_left_label(
+        self, date_key: Optional[str] = None, total_seconds: Optional[int] = None
+    ) -> None:
+        if date_key is None:
+            date_key = self._date_key(QDate.currentDate())
         goal_seconds = self._goal_seconds_for_date(date_key)
         if goal_seconds <= 0:
-            self.goal_left_label.setText("Super goal left: please set goal")
+            self._set_label(self.goal_left_label, "Super goal left: please set goal")
             self.super_goal_bar.set_progress(0.0)
             return
-        total_seconds = self._total_seconds_for_day(date_key)
+        if total_seconds is None:
+            total_seconds = self._total_seconds_for_day(date_key)
         remaining = max(0, goal_seconds - total_seconds)
-        self.goal_left_label.setText(
-            f"Super goal left: {remaining // 3600:02d}:"
-            f"{(remaining % 3600) // 60:02d}:"
-            f"{remaining % 60:02d}"
+        self._set_label(
+            self.goal_left_label, f"Super goal left: {format_clock(remaining)}"
         )
         self.super_goal_bar.set_progress(total_seconds / goal_seconds)
 
@@ -5058,12 +5783,9 @@ class CountdownWindow(QMainWindow):
         return max(0, goal_seconds - total_seconds)
 
     def _cycle_year_total_display(self) -> None:
-        try:
-            index = YEAR_TOTAL_DISPLAY_MODES.index(self.settings.year_total_display)
-        except ValueError:
-            index = 0
-        next_index = (index + 1) % len(YEAR_TOTAL_DISPLAY_MODES)
-        self.settings.year_total_display = YEAR_TOTAL_DISPLAY_MODES[next_index]
+        self.settings.year_total_display = YEAR_TOTAL_NEXT_DISPLAY.get(
+            self.settings.year_total_display, YEAR_TOTAL_DISPLAY_MODES[1]
+        )
         self._update_year_total_label()
         QTimer.singleShot(0, self._animate_year_total_label)
         self._save_settings()
@@ -5084,6 +5806,116 @@ class CountdownWindow(QMainWindow):
         start = end.addDays(-6)
         return start, end
 
+    def _year_day_totals_for(self, year: int) -> array.array:
+        key = (id(self.daily_totals), year)
+        if self._year_day_totals_key != key:
+            totals = array.array("q", bytes(8 * 366))
+            first_ordinal = datetime.date(year, 1, 1).toordinal()
+            self._index_year_totals()
+            for date_key, seconds in self._totals_by_year.get(year, {}).items():
+                try:
+                    day = datetime.date.fromisoformat(date_key)
+                except ValueError:
+                    continue
+                totals[day.toordinal() - first_ordinal] += seconds
+            self._year_day_totals = totals
+            self._year_day_totals_key = key
+        return self._year_day_totals
+
+    def _index_year_totals(self) -> None:
+        if self._year_totals_source == id(self.daily_totals):
+            return
+        by_year: defaultdict[int, dict[str, int]] = defaultdict(dict)
+        for date_key, seconds in self.daily_totals.items():
+            try:
+                by_year[int(date_key[:4])][date_key] = seconds
+            except ValueError:
+                continue
+        self._totals_by_year = dict(by_year)
+        self._year_totals = {
+            year: sum(days.values()) for year, days in self._totals_by_year.items()
+        }
+        self._year_totals_source = id(self.daily_totals)
+
+    def _year_total_seconds(self, year: int) -> int:
+        self._index_year_totals()
+        return self._year_totals.get(year, 0)
+
+    def _add_day_seconds(self, date_key: str, delta: int) -> None:
+        totals = self.daily_totals
+        previous = totals.get(date_key, 0)
+        updated = previous + delta
+        if updated <= 0:
+            totals.pop(date_key, None)
+            updated = 0
+        else:
+            totals[date_key] = updated
+        self._data_generation += 1
+        if self._year_totals_source == id(totals):
+            try:
+                year = int(date_key[:4])
+            except ValueError:
+                year = None
+            if year is not None:
+                self._year_totals[year] = (
+                    self._year_totals.get(year, 0) + updated - previous
+                )
+                year_days = self._totals_by_year.setdefault(year, {})
+                if updated:
+                    year_days[date_key] = updated
+                else:
+                    year_days.pop(date_key, None)
+        self._sync_year_day_total(date_key)
+
+    def _sync_year_day_total(self, date_key: str) -> None:
+        if self._year_day_totals_key is None:
+            return
+        if self._year_day_totals_key[0] != id(self.daily_totals):
+            return
+        year = self._year_day_totals_key[1]
+        if not date_key.startswith(f"{year}-"):
+            return
+        try:
+            day = datetime.date.fromisoformat(date_key)
+        except ValueError:
+            return
+        first_ordinal = datetime.date(year, 1, 1).toordinal()
+        self._year_day_totals[day.toordinal() - first_ordinal] = (
+            self.daily_totals.get(date_key, 0)
+        )
+
+    def _stored_range_seconds(self, start: QDate, end: QDate) -> int:
+        if start.year() == end.year():
+            day_totals = self._year_day_totals_for(start.year())
+            return sum(day_totals[start.dayOfYear() - 1 : end.dayOfYear()])
+        totals = self.daily_totals
+        first = datetime.date(start.year(), start.month(), start.day())
+        return sum(
+            totals.get((first + datetime.timedelta(days=offset)).isoformat(), 0)
+            for offset in range(start.daysTo(end) + 1)
+        )
+
+    def _week_total_seconds(self, today: QDate) -> int:
+        key = (
+            self._data_generation,
+            id(self.daily_totals),
+            today.toJulianDay(),
+            self.settings.week_end_day,
+        )
+        if key != self._week_total_key:
+            start, end = self._week_range_for_date(today)
+            self._week_total = (
+                self._date_key(start),
+                self._date_key(end),
+                self._stored_range_seconds(start, end),
+            )
+            self._week_total_key = key
+        start_key, end_key, total = self._week_total
+        active_key = self._active_session_date_key
+        if active_key and start_key <= active_key <= end_key:
+            total += self._active_session_seconds
+        return total
+
     def _animate_year_total_label(self) -> None:
         if self.year_total_label is None:
             return
@@ -5102,55 +5934,53 @@ class CountdownWindow(QMainWindow):
         self._year_total_anim.start()
 
     def _update_year_total_label(self) -> None:
-        current_year = QDate.currentDate().year()
+        today = QDate.currentDate()
+        state = (
+            today.toJulianDay(),
+            self.settings.year_total_display,
+            self.settings.week_end_day,
+            self._data_generation,
+            id(self.daily_totals),
+            self._active_session_date_key,
+            self._active_session_seconds,
+        )
+        if state == self._year_total_state:
+            return
+        self._year_total_state = state
+        current_year = today.year()
         year_prefix = f"{current_year}-"
-        total_seconds = sum(
-            seconds
-            for date_key, seconds in self.daily_totals.items()
-            if date_key.startswith(year_prefix)
-        )
+        total_seconds = self._year_total_seconds(current_year)
         if (
             self._active_session_date_key
             and self._active_session_date_key.startswith(year_prefix)
         ):
             total_seconds += self._active_session_seconds
         display = self.settings.year_total_display
-        if display not in YEAR_TOTAL_DISPLAY_MODES:
+        if display not in YEAR_TOTAL_NEXT_DISPLAY:
             display = "hours"
             self.settings.year_total_display = display
-        if display == "days":
-            days = total_seconds // 86400
-            remainder = total_seconds % 86400
-            hours = remainder // 3600
-            minutes = (remainder % 3600) // 60
-            seconds = remainder % 60
-            text = f"Year total: {days}d {hours:02d}:{minutes:02d}:{seconds:02d}"
-        elif display == "week":
-            today = QDate.currentDate()
-            start_of_week, end_of_week = self._week_range_for_date(today)
-            week_seconds = 0
-            date = start_of_week
-            while date <= end_of_week:
-                week_seconds += self._total_seconds_for_day(self._date_key(date))
-                date = date.addDays(1)
-            hours = week_seconds // 3600
-            minutes = (week_seconds % 3600) // 60
-            seconds = week_seconds % 60
-            text = f"Week total: {hours}:{minutes:02d}:{seconds:02d}"
+        if display == "week":
+            value = self._week_total_seconds(today)
         elif display == "avg_week":
             start_of_year = QDate(current_year, 1, 1)
-            days_elapsed = start_of_year.daysTo(QDate.currentDate()) + 1
+            days_elapsed = start_of_year.daysTo(today) + 1
             days_elapsed = max(1, days_elapsed)
-            avg_week_seconds = int(round(total_seconds * 7 / days_elapsed))
-            hours = avg_week_seconds // 3600
-            minutes = (avg_week_seconds % 3600) // 60
-            seconds = avg_week_seconds % 60
-            text = f"Year avg/week: {hours:02d}:{minutes:02d}:{seconds:02d}"
+            value = int(round(total_seconds * 7 / days_elapsed))
+        else:
+            value = total_seconds
+        key = (display, value)
+        if key == self._year_total_text_key:
+            return
+        self._year_total_text_key = key
+        if display == "days":
+            days, remainder = divmod(value, 86400)
+            text = f"Year total: {days}d {format_clock(remainder)}"
+        elif display == "week":
+            text = f"Week total: {format_clock(value, pad_hours=False)}"
+        elif display == "avg_week":
+            text = f"Year avg/week: {format_clock(value)}"
         else:
-            hours = total_seconds // 3600
-            minutes = (total_seconds % 3600) // 60
-            seconds = total_seconds % 60
-            text = f"Year total: {hours}:{minutes:02d}:{seconds:02d}"
+            text = f"Year total: {format_clock(value, pad_hours=False)}"
         self.year_total_label.setText(text)
         self.year_total_label.setToolTip(self._year_total_tooltip(display))
 
@@ -5158,11 +5988,11 @@ class CountdownWindow(QMainWindow):
         longest, current = self._calculate_streaks()
         longest_label = "day" if longest == 1 else "days"
         current_label = "day" if current == 1 else "days"
-        self.longest_streak_label.setText(
-            f"Longest streak: {longest} {longest_label}"
+        self._set_label(
+            self.longest_streak_label, f"Longest streak: {longest} {longest_label}"
         )
-        self.current_streak_label.setText(
-            f"Current streak: {current} {current_label}"
+        self._set_label(
+            self.current_streak_label, f"Current streak: {current} {current_label}"
         )
         self._check_achievements(current)
 
@@ -5241,10 +6071,22 @@ class CountdownWindow(QMainWindow):
             self.showNormal()
             self.raise_()
             self.activateWindow()
+        if event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                self.day_time_timer.stop()
+            elif not self.day_time_timer.isActive():
+                self._day_time_tick()
+
+    def _schedule_day_time_tick(self) -> None:
+        self.day_time_timer.start(1000 - QTime.currentTime().msec())
+
+    def _day_time_tick(self) -> None:
+        self._update_day_time_label()
+        self._schedule_day_time_tick()
 
     def resizeEvent(self, event) -> None:
         super().resizeEvent(event)
-        self._apply_scaled_metrics()
+        self._scale_timer.start()
         self._schedule_window_save()
 
     def moveEvent(self, event) -> None:
@@ -5252,7 +6094,9 @@ class CountdownWindow(QMainWindow):
         self._schedule_window_save()
 
     def closeEvent(self, event) -> None:
+        self._window_save_timer.stop()
         self._save_window_geometry()
+        self._close_log_handle()
         super().closeEvent(event)
 
     def eventFilter(self, obj, event) -> bool:
@@ -5280,11 +6124,22 @@ class CountdownWindow(QMainWindow):
         if delta == 0:
             return False
         step = 1 if delta > 0 else -1
-        self._set_base_heatmap_cell_size(
-            self._heatmap_base_size + step, save=True
+        base = self._heatmap_base_size
+        self._pending_heatmap_steps = max(
+            HEATMAP_CELL_SIZE_MIN - base,
+            min(HEATMAP_CELL_SIZE_MAX - base, self._pending_heatmap_steps + step),
         )
+        self._heatmap_wheel_timer.start()
         return True
 
+    def _apply_heatmap_wheel(self) -> None:
+        steps = self._pending_heatmap_steps
+        self._pending_heatmap_steps = 0
+        if steps:
+            self._set_base_heatmap_cell_size(
+                self._heatmap_base_size + steps, save=True
+            )
+
     def _restore_after_toggle(self, enabled: bool) -> None:
         if self.isMinimized():
             self.setWindowState(self.windowState() & ~Qt.WindowMinimized)
@@ -5304,6 +6159,7 @@ class CountdownWindow(QMainWindow):
             lambda checked, key=setting_key: self._toggle_ui_setting(key, checked)
         )
         menu.addAction(action)
+        self._visibility_actions[setting_key] = action
         return action
 
     def _toggle_ui_setting(self, setting_key: str, enabled: bool) -> None:
@@ -5347,20 +6203,25 @@ class CountdownWindow(QMainWindow):
         return hours, minutes
 
     def _date_key(self, date: QDate) -> str:
-        return date.toString("yyyy-MM-dd")
+        return qdate_to_key(date)
 
-    def _goal_seconds_for_date(self, date_key: str) -> int:
-        if date_key in self.daily_goals:
-            return self.daily_goals[date_key]
-        if date_key == self._date_key(QDate.currentDate()):
-            return self.super_goal_seconds
-        return 0
+    def _goal_seconds_for_date(
+        self, date_key: str, today_key: Optional[str] = None
+    ) -> int:
+        goal_seconds = self.daily_goals.get(date_key)
+        if goal_seconds is not None:
+            return goal_seconds
+        if today_key is None:
+            today_key = self._date_key(QDate.currentDate())
+        return self.super_goal_seconds if date_key == today_key else 0
 
     def _set_daily_goal(self, date: QDate, goal_seconds: int, record: bool) -> None:
         date_key = self._date_key(date)
         if self.daily_goals.get(date_key) == goal_seconds:
             return
         self.daily_goals[date_key] = goal_seconds
+        self._data_generation += 1
+        self._schedule_heatmap_cell(date_key)
         if record:
             self._append_goal_update(date_key, goal_seconds)
 
@@ -5402,11 +6263,11 @@ class CountdownWindow(QMainWindow):
                 "goal_seconds": goal_seconds,
             }
         )
-        self.daily_totals[date_key] = self.daily_totals.get(date_key, 0) + duration
+        self._add_day_seconds(date_key, duration)
         self._active_session_start = None
         self._active_session_seconds = 0
         self._active_session_date_key = None
-        self._update_heatmap_cell(date_key)
+        self._schedule_heatmap_cell(date_key)
         self._update_total_today_label()
 
     def _total_seconds_for_day(self, date_key: str) -> int:
@@ -5427,49 +6288,33 @@ class CountdownWindow(QMainWindow):
         return self._total_seconds_for_day(date_key) >= goal_seconds
 
     def _calculate_streaks(self) -> tuple[int, int]:
-        goal_dates: list[QDate] = []
-        for date_key, goal_seconds in self.daily_goals.items():
-            if goal_seconds <= 0:
+        active_key = self._active_session_date_key
+        active_met = bool(active_key) and self._goal_met_on_date(active_key)
+        key = (
+            self._data_generation,
+            id(self.daily_goals),
+            id(self.daily_totals),
+            datetime.date.today().toordinal(),
+            active_key,
+            active_met,
+        )
+        if key == self._streak_cache_key:
+            return self._streak_cache
+        self._streak_cache = self._compute_streaks()
+        self._streak_cache_key = key
+        return self._streak_cache
+
+    def _compute_streaks(self) -> tuple[int, int]:
+        goals = self.daily_goals
+        met_days: list[int] = []
+        for date_key in sorted(key for key, value in goals.items() if value > 0):
+            if self._total_seconds_for_day(date_key) < goals[date_key]:
                 continue
-            date = QDate.fromString(date_key, "yyyy-MM-dd")
-            if date.isValid():
-                goal_dates.append(date)
-        goal_dates.sort(key=lambda date: date.toJulianDay())
-
-        longest = 0
-        running = 0
-        prev_date = None
-        for date in goal_dates:
-            met = self._goal_met_on_date(self._date_key(date))
-            if met:
-                if prev_date is not None and prev_date.addDays(1) == date:
-                    running += 1
-                else:
-                    running = 1
-                longest = max(longest, running)
-            else:
-                running = 0
-            prev_date = date
-
-        today = QDate.currentDate()
-        latest_met = None
-        for date in reversed(goal_dates):
-            if self._goal_met_on_date(self._date_key(date)):
-                latest_met = date
-                break
-
-        if latest_met is None:
-            return longest, 0
-        if latest_met < today.addDays(-1):
-            return longest, 0
-
-        current_streak = 0
-        date = latest_met
-        while self._goal_met_on_date(self._date_key(date)):
-            current_streak += 1
-            date = date.addDays(-1)
-
-        return longest, current_streak
+            try:
+                met_days.append(datetime.date.fromisoformat(date_key).toordinal())
+            except ValueError:
+                continue
+        return streak_lengths(met_days, datetime.date.today().toordinal())
 
     def _record_super_goal_progress(self, seconds: int) -> None:
         if seconds <= 0:
@@ -5484,74 +6329,39 @@ class CountdownWindow(QMainWindow):
             self._clock_offset_seconds = 0
         if current_date.year() != self._heatmap_year:
             self._refresh_heatmap()
+        goal_seconds = self._goal_seconds_for_date(current_key, current_key)
+        before = self._total_seconds_for_day(current_key)
         self._active_session_seconds += seconds
-        self._update_heatmap_cell(current_key)
-        self._update_total_today_label()
+        self._schedule_heatmap_cell(current_key)
+        crossed = 0 < goal_seconds and before < goal_seconds <= before + seconds
+        self._coarse_tick_count += 1
+        self._recompute_ui_state(
+            streaks=crossed
+            or self._coarse_tick_count % STREAK_REFRESH_TICKS == 0
+        )
 
     def _load_settings(self) -> UiSettings:
         settings = get_settings()
         ui = UiSettings()
-        ui.blur_radius = int(settings.value("blur/radius", ui.blur_radius))
-        ui.opacity = float(settings.value("blur/opacity", ui.opacity))
-        ui.bg_color = hex_to_qcolor(
-            settings.value("colors/background", qcolor_to_hex(ui.bg_color)), ui.bg_color
-        )
-        ui.text_color = hex_to_qcolor(
-            settings.value("colors/text", qcolor_to_hex(ui.text_color)), ui.text_color
-        )
-        ui.accent_color = hex_to_qcolor(
-            settings.value("colors/accent", qcolor_to_hex(ui.accent_color)),
-            ui.accent_color,
-        )
-        ui.day_time_color = hex_to_qcolor(
-            settings.value("colors/day_time", qcolor_to_hex(ui.day_time_color)),
-            ui.day_time_color,
-        )
-        ui.heatmap_color = hex_to_qcolor(
-            settings.value("colors/heatmap", qcolor_to_hex(ui.heatmap_color)),
-            ui.heatmap_color,
-        )
-        ui.heatmap_hover_bg_color = hex_to_qcolor(
-            settings.value(
-                "colors/heatmap_hover_bg", qcolor_to_hex(ui.heatmap_hover_bg_color)
-            ),
-            ui.heatmap_hover_bg_color,
-        )
-        ui.heatmap_hover_text_color = hex_to_qcolor(
-            settings.value(
-                "colors/heatmap_hover_text", qcolor_to_hex(ui.heatmap_hover_text_color)
-            ),
-            ui.heatmap_hover_text_color,
-        )
-        ui.heatmap_hover_cell_color = hex_to_qcolor(
-            settings.value(
-                "colors/heatmap_hover_cell",
-                qcolor_to_hex(ui.heatmap_hover_cell_color),
-            ),
-            ui.heatmap_hover_cell_color,
-        )
-        ui.graph_line_color = hex_to_qcolor(
-            settings.value(
-                "colors/graph_line", qcolor_to_hex(ui.graph_line_color)
-            ),
-            ui.graph_line_color,
-        )
-        ui.graph_dot_color = hex_to_qcolor(
-            settings.value("colors/graph_dot", qcolor_to_hex(ui.graph_dot_color)),
-            ui.graph_dot_color,
-        )
-        ui.graph_fill_color = hex_to_qcolor(
-            settings.value(
-                "colors/graph_fill", qcolor_to_hex(ui.graph_fill_color)
-            ),
-            ui.graph_fill_color,
-        )
-        ui.graph_grid_color = hex_to_qcolor(
-            settings.value(
-                "colors/graph_grid", qcolor_to_hex(ui.graph_grid_color)
-            ),
-            ui.graph_grid_color,
+        for key, attr, kind in UI_SETTINGS_SCHEMA:
+            raw = settings.value(key)
+            if raw is None:
+                continue
+            if kind is QColor:
+                value = hex_to_qcolor(raw, getattr(ui, attr))
+            elif kind is bool:
+                value = parse_bool(raw, getattr(ui, attr))
+            else:
+                value = kind(raw)
+            setattr(ui, attr, value)
+        ui.heatmap_cell_size = max(
+            HEATMAP_CELL_SIZE_MIN,
+            min(HEATMAP_CELL_SIZE_MAX, ui.heatmap_cell_size),
         )
+        ui.heatmap_month_padding = max(0, ui.heatmap_month_padding)
+        ui.heatmap_month_label_size = max(6, ui.heatmap_month_label_size)
+        ui.super_goal_bar_width = max(40, ui.super_goal_bar_width)
+        ui.super_goal_bar_height = max(4, ui.super_goal_bar_height)
         graph_range_format = settings.value(
             "graph/range_date_format", ui.graph_range_date_format
         )
@@ -5562,88 +6372,6 @@ class CountdownWindow(QMainWindow):
         if graph_range_format not in ("mm/dd/yy", "yy/mm/dd", "dd/mm/yy"):
             graph_range_format = ui.graph_range_date_format
         ui.graph_range_date_format = graph_range_format
-        ui.heatmap_cell_size = int(
-            settings.value("heatmap/cell_size", ui.heatmap_cell_size)
-        )
-        ui.heatmap_cell_size = max(
-            HEATMAP_CELL_SIZE_MIN,
-            min(HEATMAP_CELL_SIZE_MAX, ui.heatmap_cell_size),
-        )
-        ui.heatmap_month_padding = int(
-            settings.value("heatmap/month_padding", ui.heatmap_month_padding)
-        )
-        ui.heatmap_month_padding = max(0, ui.heatmap_month_padding)
-        ui.heatmap_month_label_size = int(
-            settings.value(
-                "heatmap/month_label_size", ui.heatmap_month_label_size
-            )
-        )
-        ui.heatmap_month_label_size = max(6, ui.heatmap_month_label_size)
-        ui.total_today_color = hex_to_qcolor(
-            settings.value("colors/total_today", qcolor_to_hex(ui.total_today_color)),
-            ui.total_today_color,
-        )
-        ui.goal_left_color = hex_to_qcolor(
-            settings.value("colors/goal_left", qcolor_to_hex(ui.goal_left_color)),
-            ui.goal_left_color,
-        )
-        ui.super_goal_bar_start = hex_to_qcolor(
-            settings.value(
-                "colors/super_goal_bar_start",
-                qcolor_to_hex(ui.super_goal_bar_start),
-            ),
-            ui.super_goal_bar_start,
-        )
-        ui.super_goal_bar_end = hex_to_qcolor(
-            settings.value(
-                "colors/super_goal_bar_end",
-                qcolor_to_hex(ui.super_goal_bar_end),
-            ),
-            ui.super_goal_bar_end,
-        )
-        ui.super_goal_bar_bg = hex_to_qcolor(
-            settings.value(
-                "colors/super_goal_bar_bg",
-                qcolor_to_hex(ui.super_goal_bar_bg),
-            ),
-            ui.super_goal_bar_bg,
-        )
-        ui.font_size = int(settings.value("fonts/timer", ui.font_size))
-        ui.label_size = int(settings.value("fonts/label", ui.label_size))
-        ui.day_time_font_size = int(
-            settings.value("fonts/day_time", ui.day_time_font_size)
-        )
-        ui.total_today_font_size = int(
-            settings.value("fonts/total_today", ui.total_today_font_size)
-        )
-        ui.goal_left_font_size = int(
-            settings.value("fonts/goal_left", ui.goal_left_font_size)
-        )
-        ui.super_goal_bar_width = int(
-            settings.value("super_goal_bar/width", ui.super_goal_bar_width)
-        )
-        ui.super_goal_bar_height = int(
-            settings.value("super_goal_bar/height", ui.super_goal_bar_height)
-        )
-        ui.super_goal_bar_width = max(40, ui.super_goal_bar_width)
-        ui.super_goal_bar_height = max(4, ui.super_goal_bar_height)
-        ui.goal_pulse_seconds = float(
-            settings.value("goal_pulse/seconds", ui.goal_pulse_seconds)
-        )
-        ui.always_on_top = parse_bool(
-            settings.value("window/always_on_top", ui.always_on_top),
-            ui.always_on_top,
-        )
-        ui.day_start_hour = int(
-            settings.value("day_time/start_hour", ui.day_start_hour)
-        )
-        ui.day_start_minute = int(
-            settings.value("day_time/start_minute", ui.day_start_minute)
-        )
-        ui.day_end_hour = int(settings.value("day_time/end_hour", ui.day_end_hour))
-        ui.day_end_minute = int(
-            settings.value("day_time/end_minute", ui.day_end_minute)
-        )
         try:
             week_start_day = int(
                 settings.value("totals/week_start_day", ui.week_start_day)
@@ -5666,70 +6394,17 @@ class CountdownWindow(QMainWindow):
         )
         if isinstance(year_total_display, str):
             year_total_display = year_total_display.strip().lower()
-        if year_total_display not in YEAR_TOTAL_DISPLAY_MODES:
+        if year_total_display not in YEAR_TOTAL_NEXT_DISPLAY:
             year_total_display = ui.year_total_display
         ui.year_total_display = year_total_display
-        ui.show_heatmap = parse_bool(
-            settings.value("ui/show_heatmap", ui.show_heatmap), ui.show_heatmap
-        )
-        ui.show_day_time = parse_bool(
-            settings.value("ui/show_day_time", ui.show_day_time), ui.show_day_time
-        )
-        ui.show_total_today = parse_bool(
-            settings.value("ui/show_total_today", ui.show_total_today),
-            ui.show_total_today,
-        )
-        ui.show_year_total = parse_bool(
-            settings.value("ui/show_year_total", ui.show_year_total),
-            ui.show_year_total,
-        )
-        ui.show_super_goal_left = parse_bool(
-            settings.value("ui/show_super_goal_left", ui.show_super_goal_left),
-            ui.show_super_goal_left,
-        )
-        ui.show_status_label = parse_bool(
-            settings.value("ui/show_status_label", ui.show_status_label),
-            ui.show_status_label,
-        )
-        ui.show_start_button = parse_bool(
-            settings.value("ui/show_start_button", ui.show_start_button),
-            ui.show_start_button,
-        )
-        ui.show_clock_button = parse_bool(
-            settings.value("ui/show_clock_button", ui.show_clock_button),
-            ui.show_clock_button,
-        )
-        ui.show_longest_streak = parse_bool(
-            settings.value("ui/show_longest_streak", ui.show_longest_streak),
-            ui.show_longest_streak,
-        )
-        ui.show_current_streak = parse_bool(
-            settings.value("ui/show_current_streak", ui.show_current_streak),
-            ui.show_current_streak,
-        )
-        ui.use_24h_time = parse_bool(
-            settings.value("ui/use_24h_time", ui.use_24h_time),
-            ui.use_24h_time,
-        )
         return ui
 
     def _load_hotkey_settings(self) -> HotkeySettings:
         settings = get_settings()
         hotkeys = HotkeySettings()
-        hotkeys.start_hotkey = str(
-            settings.value("hotkeys/start", hotkeys.start_hotkey) or ""
-        )
-        hotkeys.clock_hotkey = str(
-            settings.value("hotkeys/clock", hotkeys.clock_hotkey) or ""
-        )
-        hotkeys.start_xinput_button = str(
-            settings.value("xinput/start_button", hotkeys.start_xinput_button)
-            or ""
-        )
-        hotkeys.clock_xinput_button = str(
-            settings.value("xinput/clock_button", hotkeys.clock_xinput_button)
-            or ""
-        )
+        for key, attr in HOTKEY_SETTINGS_SCHEMA:
+            value = settings.value(key, getattr(hotkeys, attr))
+            setattr(hotkeys, attr, str(value or ""))
         return hotkeys
 
     def _legacy_super_goal_seconds(
@@ -5794,9 +6469,7 @@ class CountdownWindow(QMainWindow):
         if not os.path.exists(path) or os.path.getsize(path) == 0:
             with open(path, "w", newline="", encoding="utf-8") as handle:
                 writer = csv.writer(handle)
-                writer.writerow(
-                    ["date", "start_time", "end_time", "duration_seconds", "goal_seconds"]
-                )
+                writer.writerow(LOG_FILE_HEADER)
 
     def _ensure_data_file(self) -> None:
         self._ensure_data_file_path(self._data_file_path)
@@ -5818,33 +6491,52 @@ class CountdownWindow(QMainWindow):
         self, path: str, *, fallback_goal_seconds: Optional[int] = None
     ) -> tuple[list[dict[str, object]], dict[str, int], dict[str, int]]:
         self._ensure_data_file_path(path)
+        if fallback_goal_seconds is None:
+            fallback_goal_seconds = self.super_goal_seconds
+        return self._finish_log_load(
+            path, self._parse_log_file(path, fallback_goal_seconds)
+        )
+
+    def _parse_log_file(self, path: str, fallback_goal_seconds: int) -> tuple:
+        # Runs on the profile-load pool thread too, so it must not write.
         entries: list[dict[str, object]] = []
-        totals: dict[str, int] = {}
+        totals: defaultdict[str, int] = defaultdict(int)
         daily_goals: dict[str, int] = {}
-        with open(path, newline="", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle)
-            if reader.fieldnames is None:
-                return entries, totals, daily_goals
-            has_start_time = "start_time" in reader.fieldnames
-            has_end_time = "end_time" in reader.fieldnames
-            has_goal_seconds = "goal_seconds" in reader.fieldnames
-            has_label = "label" in reader.fieldnames
+        with open(
+            path, newline="", encoding="utf-8", buffering=LOG_FILE_BUFFER_SIZE
+        ) as handle:
+            reader = csv.reader(handle)
+            header = next(reader, None) or LOG_FILE_HEADER
+            columns = {name: index for index, name in enumerate(header)}
+            has_start_time = "start_time" in columns
+            has_end_time = "end_time" in columns
+            has_goal_seconds = "goal_seconds" in columns
+            has_label = "label" in columns
             needs_migration = (
-                "time" in reader.fieldnames
+                "time" in columns
                 or not has_start_time
                 or not has_end_time
                 or not has_goal_seconds
                 or not has_label
             )
-            if fallback_goal_seconds is None:
-                fallback_goal_seconds = self.super_goal_seconds
+            date_index = columns.get("date", -1)
+            duration_index = columns.get("duration_seconds", -1)
+            goal_index = columns.get("goal_seconds", -1)
+            start_index = columns.get("start_time" if has_start_time else "time", -1)
+            end_index = columns.get("end_time", -1)
+            label_index = columns.get("label", -1)
             fallback_goal = fallback_goal_seconds if fallback_goal_seconds > 0 else 0
+            legacy_goals: dict[str, int] = {}
+            append_entry = entries.append
             for row in reader:
-                date_key = row.get("date")
-                duration_str = row.get("duration_seconds")
+                width = len(row)
+                date_key = row[date_index] if 0 <= date_index < width else None
+                duration_str = (
+                    row[duration_index] if 0 <= duration_index < width else None
+                )
                 if not date_key or duration_str is None:
                     continue
-                goal_value = row.get("goal_seconds") if has_goal_seconds else None
+                goal_value = row[goal_index] if 0 <= goal_index < width else None
                 try:
                     goal_seconds = int(goal_value) if goal_value else fallback_goal
                 except (TypeError, ValueError):
@@ -5854,22 +6546,23 @@ class CountdownWindow(QMainWindow):
                     duration = int(duration_str)
                 except (TypeError, ValueError):
                     continue
-                start_time = (
-                    row.get("start_time")
-                    if has_start_time
-                    else row.get("time")
-                )
-                end_time = row.get("end_time") if has_end_time else None
-                user_label = row.get("label", "") if has_label else ""
+                # Legacy goal-only rows; they move to the goals file on migration.
+                if duration <= 0:
+                    legacy_goals[date_key] = goal_seconds
+                    continue
+                start_time = row[start_index] if 0 <= start_index < width else None
+                end_time = row[end_index] if 0 <= end_index < width else None
+                if 0 <= label_index < width:
+                    user_label = row[label_index]
+                else:
+                    user_label = ""
                 if not start_time:
                     start_time = "N/A"
                 if not end_time and start_time not in ("N/A", ""):
-                    end_time = self._compute_end_time(start_time, duration)
+                    end_time = compute_end_time(start_time, duration)
                 if not end_time:
                     end_time = "N/A"
-                if duration <= 0:
-                    continue
-                entries.append(
+                append_entry(
                     {
                         "date": date_key,
                         "start_time": start_time,
@@ -5879,11 +6572,54 @@ class CountdownWindow(QMainWindow):
                         "label": user_label,
                     }
                 )
-                totals[date_key] = totals.get(date_key, 0) + duration
+                totals[date_key] += duration
+        goal_updates = self._load_goal_updates(goals_file_path(path))
+        migrated_goals = None
+        if legacy_goals:
+            legacy_goals.update(goal_updates)
+            goal_updates = migrated_goals = legacy_goals
+            needs_migration = True
+        daily_goals.update(goal_updates)
+        return entries, totals, daily_goals, migrated_goals, needs_migration
+
+    def _finish_log_load(
+        self, path: str, parsed: tuple
+    ) -> tuple[list[dict[str, object]], dict[str, int], dict[str, int]]:
+        entries, totals, daily_goals, migrated_goals, needs_migration = parsed
+        if migrated_goals is not None:
+            self._write_goal_updates(goals_file_path(path), migrated_goals)
         if needs_migration:
             self._rewrite_log_file(entries, daily_goals, path=path)
         return entries, totals, daily_goals
 
+    def _load_goal_updates(self, path: str) -> dict[str, int]:
+        try:
+            with open(path, encoding="utf-8") as handle:
+                data = json.load(handle)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            LOGGER.exception("Failed to read goals file")
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        goals: dict[str, int] = {}
+        for date_key, goal_seconds in data.items():
+            try:
+                goals[str(date_key)] = max(0, int(goal_seconds))
+            except (TypeError, ValueError):
+                continue
+        return goals
+
+    def _write_goal_updates(self, path: str, goals: dict[str, int]) -> None:
+        temp_path = f"{path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as handle:
+                json.dump(goals, handle, sort_keys=True)
+            os.replace(temp_path, path)
+        except OSError:
+            LOGGER.exception("Failed to write goals file")
+
     def _profile_color_key(self, label: str) -> str:
         return f"profiles/colors/{label.strip().lower()}"
 
@@ -5946,14 +6682,6 @@ class CountdownWindow(QMainWindow):
         settings.remove(self._profile_color_key(label))
         settings.sync()
 
-    def _compute_end_time(self, start_time: str, duration: int) -> str:
-        time = QTime.fromString(start_time, "HH:mm:ss")
-        if not time.isValid():
-            time = QTime.fromString(start_time, "HH:mm")
-        if not time.isValid():
-            return "N/A"
-        return time.addSecs(duration).toString("HH:mm:ss")
-
     def _append_log_entry(
         self,
         date_key: str,
@@ -5963,13 +6691,40 @@ class CountdownWindow(QMainWindow):
         goal_seconds: int,
         label: str = "",
     ) -> None:
-        self._ensure_data_file()
-        with open(self._data_file_path, "a", newline="", encoding="utf-8") as handle:
-            writer = csv.writer(handle)
-            writer.writerow([date_key, start_time, end_time, duration, goal_seconds, label])
+        writer = self._log_writer_for(self._data_file_path)
+        writer.writerow([date_key, start_time, end_time, duration, goal_seconds, label])
+        self._log_handle.flush()
+
+    def _log_writer_for(self, path: str):
+        if self._log_handle is not None and self._log_handle_path != path:
+            self._close_log_handle()
+        if self._log_handle is None:
+            self._ensure_data_file_path(path)
+            self._log_handle = open(path, "a", newline="", encoding="utf-8")
+            self._log_writer = csv.writer(self._log_handle)
+            self._log_handle_path = path
+        return self._log_writer
+
+    def _close_log_handle(self) -> None:
+        handle = self._log_handle
+        if handle is None:
+            return
+        self._log_handle = None
+        self._log_writer = None
+        self._log_handle_path = None
+        try:
+            handle.flush()
+            os.fsync(handle.fileno())
+        except OSError:
+            LOGGER.exception("Failed to flush log file")
+        finally:
+            handle.close()
 
     def _append_goal_update(self, date_key: str, goal_seconds: int) -> None:
-        self._append_log_entry(date_key, "goal", "goal", 0, goal_seconds)
+        path = goals_file_path(self._data_file_path)
+        goals = self._load_goal_updates(path)
+        goals[date_key] = goal_seconds
+        self._write_goal_updates(path, goals)
 
     def _rewrite_log_file(
         self,
@@ -5979,11 +6734,15 @@ class CountdownWindow(QMainWindow):
         path: Optional[str] = None,
     ) -> None:
         target_path = path or self._data_file_path
-        with open(target_path, "w", newline="", encoding="utf-8") as handle:
+        with open(
+            target_path,
+            "w",
+            newline="",
+            encoding="utf-8",
+            buffering=LOG_FILE_BUFFER_SIZE,
+        ) as handle:
             writer = csv.writer(handle)
-            writer.writerow(
-                ["date", "start_time", "end_time", "duration_seconds", "goal_seconds", "label"]
-            )
+            writer.writerow(LOG_FILE_HEADER)
             for entry in entries:
                 date_key = entry["date"]
                 goal_seconds = entry.get("goal_seconds")
@@ -6018,22 +6777,20 @@ class CountdownWindow(QMainWindow):
         settings = get_settings()
         value = settings.value("profiles/custom", [])
         if isinstance(value, str):
-            raw = [item.strip() for item in value.split("|")]
+            raw = value.split("|")
         elif isinstance(value, (list, tuple)):
-            raw = [str(item).strip() for item in value]
+            raw = map(str, value)
         else:
-            raw = []
+            raw = ()
         labels: list[str] = []
         seen = set()
+        defaults = self._default_profile_files
         for label in raw:
+            label = label.strip()
             if not label:
                 continue
-            if self._is_profile_label_reserved(label):
-                continue
-            key = label.strip().lower()
-            if key in seen:
-                continue
-            if label in self._default_profile_files:
+            key = label.lower()
+            if key in RESERVED_PROFILE_LABELS or key in seen or label in defaults:
                 continue
             seen.add(key)
             labels.append(label)
@@ -6070,13 +6827,15 @@ class CountdownWindow(QMainWindow):
         return os.path.join(self._data_dir, self._profile_filename(label))
 
     def _is_profile_label_reserved(self, label: str) -> bool:
-        return label.strip().lower() in ("add profile", "delete profile")
+        return label.strip().lower() in RESERVED_PROFILE_LABELS
+
+    def _sync_profile_label_keys(self) -> None:
+        self._profile_label_keys = {
+            label.lower() for label in self._default_profile_files
+        } | {label.lower() for label in self._custom_profiles}
 
     def _profile_exists(self, label: str) -> bool:
-        return any(
-            existing.lower() == label.strip().lower()
-            for existing in self._profile_labels()
-        )
+        return label.strip().lower() in self._profile_label_keys
 
     def _populate_profile_combo(self) -> None:
         if not hasattr(self, "profile_combo"):
@@ -6094,10 +6853,9 @@ class CountdownWindow(QMainWindow):
     def _restore_profile_selection(self) -> None:
         if not hasattr(self, "profile_combo"):
             return
-        for index in range(self.profile_combo.count()):
-            if self.profile_combo.itemData(index) == self._active_profile:
-                self.profile_combo.setCurrentIndex(index)
-                return
+        index = self.profile_combo.findData(self._active_profile)
+        if index >= 0:
+            self.profile_combo.setCurrentIndex(index)
 
     def _profile_change_locked(self) -> bool:
         return self.timer_active or self.clock_active
@@ -6127,11 +6885,14 @@ class CountdownWindow(QMainWindow):
             self._prompt_delete_profile()
             return
         if isinstance(data, str) and data:
-            if data == self._active_profile:
+            if data == self._active_profile and not self._profile_loading:
                 return
             self._switch_profile(data)
 
     def _prompt_add_profile(self) -> None:
+        if self._profile_busy():
+            self._restore_profile_selection()
+            return
         name, ok = QInputDialog.getText(
             self, "Add Profile", "Profile name"
         )
@@ -6154,14 +6915,18 @@ class CountdownWindow(QMainWindow):
             self._restore_profile_selection()
             return
         self._custom_profiles.append(label)
+        self._sync_profile_label_keys()
         self._save_profile_super_goal_seconds(label, self.super_goal_seconds)
-        self._active_profile = label
-        self._data_file_path = self._profile_file_path(label)
-        self._save_profile_settings()
-        self._populate_profile_combo()
+        self.profile_combo.blockSignals(True)
+        self.profile_combo.insertItem(self.profile_combo.count() - 3, label, label)
         self._switch_profile(label)
+        self._restore_profile_selection()
+        self.profile_combo.blockSignals(False)
 
     def _prompt_delete_profile(self) -> None:
+        if self._profile_busy():
+            self._restore_profile_selection()
+            return
         options = list(self._custom_profiles)
         if not options:
             self.status_label.setText("No custom profiles to delete")
@@ -6177,10 +6942,16 @@ class CountdownWindow(QMainWindow):
         was_active = label == self._active_profile
         if label in self._custom_profiles:
             self._custom_profiles.remove(label)
+            self._sync_profile_label_keys()
         path = self._profile_file_path(label)
-        if os.path.exists(path):
+        self._profile_cache.pop(path, None)
+        if path == self._log_handle_path:
+            self._close_log_handle()
+        for file_path in (path, goals_file_path(path)):
+            if not os.path.exists(file_path):
+                continue
             try:
-                os.remove(path)
+                os.remove(file_path)
             except OSError:
                 LOGGER.exception("Failed to delete profile file")
         self._clear_profile_color(label)
@@ -6188,11 +6959,14 @@ class CountdownWindow(QMainWindow):
         if was_active:
             self._active_profile = DEFAULT_PROFILE_NAME
         self._save_profile_settings()
-        self._populate_profile_combo()
+        self.profile_combo.blockSignals(True)
+        index = self.profile_combo.findData(label)
+        if index >= 0:
+            self.profile_combo.removeItem(index)
+        self._restore_profile_selection()
+        self.profile_combo.blockSignals(False)
         if was_active:
             self._switch_profile(self._active_profile)
-        else:
-            self._restore_profile_selection()
 
     def _switch_profile(self, label: str) -> None:
         if self.timer_active:
@@ -6201,24 +6975,111 @@ class CountdownWindow(QMainWindow):
             self._stop_clock("Clock off")
         self._active_profile = label
         self.super_goal_seconds = self._load_profile_super_goal_seconds(label)
+        self._close_log_handle()
         self._data_file_path = self._profile_file_path(label)
         self._last_added_time_entry = None
         self._last_added_time_index = None
         self._active_session_start = None
         self._active_session_seconds = 0
         self._active_session_date_key = None
+        self._last_added_time_file = None
         self._clock_offset_seconds = 0
-        (
-            self.log_entries,
-            self.daily_totals,
-            self.daily_goals,
-        ) = self._load_log_entries()
-        self._refresh_heatmap()
-        self._update_total_today_label()
+        self._profile_load_token += 1
+        self._profile_load_failed = False
+        path = self._data_file_path
+        cached = self._profile_cache.pop(path, None)
+        if cached is not None and cached[3] == self._profile_file_stamp(path):
+            self._profile_cache[path] = cached
+            self._profile_loading = False
+            self._profile_load_signals = None
+            self._replace_log_data(*copy_log_data(cached[0], cached[1], cached[2]))
+            self.status_label.setText(f"Profile: {label}")
+        else:
+            self._profile_loading = True
+            self._replace_log_data([], defaultdict(int), {})
+            self.status_label.setText(f"Loading profile: {label}")
+            self._start_profile_load()
         self._update_timer_label()
-        self.status_label.setText(f"Profile: {label}")
         self._save_profile_settings()
 
+    def _start_profile_load(self) -> None:
+        self._ensure_data_file_path(self._data_file_path)
+        task = ProfileLoadTask(
+            self._profile_load_token,
+            functools.partial(
+                self._parse_log_file, self._data_file_path, self.super_goal_seconds
+            ),
+        )
+        task.signals.loaded.connect(self._on_profile_loaded, Qt.QueuedConnection)
+        self._profile_load_signals = task.signals
+        QThreadPool.globalInstance().start(task)
+
+    def _file_stat_key(self, path: str) -> Optional[tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _profile_file_stamp(self, path: str) -> Optional[tuple]:
+        csv_key = self._file_stat_key(path)
+        if csv_key is None:
+            return None
+        return csv_key, self._file_stat_key(goals_file_path(path))
+
+    def _remember_profile_data(self) -> None:
+        # Copies taken while memory still matches the files.
+        path = self._data_file_path
+        cache = self._profile_cache
+        cache.pop(path, None)
+        stamp = self._profile_file_stamp(path)
+        if stamp is None:
+            return
+        cache[path] = (
+            *copy_log_data(self.log_entries, self.daily_totals, self.daily_goals),
+            stamp,
+        )
+        while len(cache) > PROFILE_CACHE_LIMIT:
+            del cache[next(iter(cache))]
+
+    def _on_profile_loaded(self, token: int, result: object) -> None:
+        if token != self._profile_load_token:
+            return
+        self._profile_load_signals = None
+        if result is None:
+            # Stay locked so the empty placeholder is never written back.
+            self._profile_load_failed = True
+            self.status_label.setText(f"Failed to load profile: {self._active_profile}")
+            return
+        self._profile_loading = False
+        self._replace_log_data(*self._finish_log_load(self._data_file_path, result))
+        self._remember_profile_data()
+        self._update_timer_label()
+        self.status_label.setText(f"Profile: {self._active_profile}")
+
+    def _replace_log_data(
+        self,
+        entries: list[dict[str, object]],
+        totals: dict[str, int],
+        goals: dict[str, int],
+    ) -> None:
+        self.log_entries = entries
+        self.daily_totals = totals
+        self.daily_goals = goals
+        # The derived caches key on id(); a freed dict's id can be reused.
+        self._year_totals_source = None
+        self._year_day_totals_key = None
+        self._data_generation += 1
+        self._heatmap_dirty = True
+        self._recompute_ui_state(heatmap=True)
+
+    def _profile_busy(self) -> bool:
+        if self._profile_load_failed:
+            self.status_label.setText(f"Failed to load profile: {self._active_profile}")
+        elif self._profile_loading:
+            self.status_label.setText(f"Loading profile: {self._active_profile}")
+        return self._profile_loading
+
     def _restore_window_geometry(self) -> None:
         settings = get_settings()
         self.setMinimumSize(self._visibility_minimum_size())
@@ -6276,134 +7137,58 @@ class CountdownWindow(QMainWindow):
         x = available.x() + max(0, (available.width() - self.width()) // 2)
         y = available.y() + max(0, (available.height() - self.height()) // 2)
         self.move(x, y)
-        self._save_window_geometry()
+        self._schedule_window_save()
 
     def _save_window_geometry(self) -> None:
-        settings = get_settings()
         rect = self.geometry()
-        settings.setValue("window/x", rect.x())
-        settings.setValue("window/y", rect.y())
-        settings.setValue("window/width", rect.width())
-        settings.setValue("window/height", rect.height())
+        geometry = (rect.x(), rect.y(), rect.width(), rect.height())
+        if geometry == self._last_saved_geometry:
+            return
+        settings = get_settings()
+        settings.setValue("window/x", geometry[0])
+        settings.setValue("window/y", geometry[1])
+        settings.setValue("window/width", geometry[2])
+        settings.setValue("window/height", geometry[3])
         settings.sync()
+        self._last_saved_geometry = geometry
 
     def _schedule_window_save(self) -> None:
-        if self._window_save_timer is None:
-            return
         self._window_save_timer.start()
 
+    def _settings_values(self) -> dict[str, object]:
+        ui = self.settings
+        values: dict[str, object] = {}
+        for key, attr, kind in UI_SETTINGS_SCHEMA:
+            value = getattr(ui, attr)
+            if kind is QColor:
+                value = qcolor_to_hex(value)
+            elif kind is bool:
+                value = int(value)
+            values[key] = value
+        values["graph/range_date_format"] = ui.graph_range_date_format
+        values["totals/year_display"] = ui.year_total_display
+        values["totals/week_start_day"] = ui.week_start_day
+        values["totals/week_end_day"] = ui.week_end_day
+        return values
+
     def _save_settings(self) -> None:
+        values = self._settings_values()
+        last_saved = self._last_saved_settings
+        changed = {
+            key: value for key, value in values.items() if last_saved.get(key) != value
+        }
+        if not changed:
+            return
         settings = get_settings()
-        settings.setValue("blur/radius", self.settings.blur_radius)
-        settings.setValue("blur/opacity", self.settings.opacity)
-        settings.setValue("colors/background", qcolor_to_hex(self.settings.bg_color))
-        settings.setValue("colors/text", qcolor_to_hex(self.settings.text_color))
-        settings.setValue("colors/accent", qcolor_to_hex(self.settings.accent_color))
-        settings.setValue("colors/day_time", qcolor_to_hex(self.settings.day_time_color))
-        settings.setValue("colors/heatmap", qcolor_to_hex(self.settings.heatmap_color))
-        settings.setValue(
-            "colors/heatmap_hover_bg",
-            qcolor_to_hex(self.settings.heatmap_hover_bg_color),
-        )
-        settings.setValue(
-            "colors/heatmap_hover_text",
-            qcolor_to_hex(self.settings.heatmap_hover_text_color),
-        )
-        settings.setValue(
-            "colors/heatmap_hover_cell",
-            qcolor_to_hex(self.settings.heatmap_hover_cell_color),
-        )
-        settings.setValue(
-            "colors/graph_line", qcolor_to_hex(self.settings.graph_line_color)
-        )
-        settings.setValue(
-            "colors/graph_dot", qcolor_to_hex(self.settings.graph_dot_color)
-        )
-        settings.setValue(
-            "colors/graph_fill", qcolor_to_hex(self.settings.graph_fill_color)
-        )
-        settings.setValue(
-            "colors/graph_grid", qcolor_to_hex(self.settings.graph_grid_color)
-        )
-        settings.setValue(
-            "graph/range_date_format", self.settings.graph_range_date_format
-        )
-        settings.setValue("heatmap/cell_size", self.settings.heatmap_cell_size)
-        settings.setValue(
-            "heatmap/month_padding", self.settings.heatmap_month_padding
-        )
-        settings.setValue(
-            "heatmap/month_label_size", self.settings.heatmap_month_label_size
-        )
-        settings.setValue(
-            "colors/total_today",
-            qcolor_to_hex(self.settings.total_today_color),
-        )
-        settings.setValue(
-            "colors/goal_left",
-            qcolor_to_hex(self.settings.goal_left_color),
-        )
-        settings.setValue(
-            "colors/super_goal_bar_start",
-            qcolor_to_hex(self.settings.super_goal_bar_start),
-        )
-        settings.setValue(
-            "colors/super_goal_bar_end",
-            qcolor_to_hex(self.settings.super_goal_bar_end),
-        )
-        settings.setValue(
-            "colors/super_goal_bar_bg",
-            qcolor_to_hex(self.settings.super_goal_bar_bg),
-        )
-        settings.setValue("fonts/timer", self.settings.font_size)
-        settings.setValue("fonts/label", self.settings.label_size)
-        settings.setValue("fonts/day_time", self.settings.day_time_font_size)
-        settings.setValue("fonts/total_today", self.settings.total_today_font_size)
-        settings.setValue("fonts/goal_left", self.settings.goal_left_font_size)
-        settings.setValue("super_goal_bar/width", self.settings.super_goal_bar_width)
-        settings.setValue("super_goal_bar/height", self.settings.super_goal_bar_height)
-        settings.setValue("goal_pulse/seconds", self.settings.goal_pulse_seconds)
-        settings.setValue("window/always_on_top", int(self.settings.always_on_top))
-        settings.setValue("day_time/start_hour", self.settings.day_start_hour)
-        settings.setValue("day_time/start_minute", self.settings.day_start_minute)
-        settings.setValue("day_time/end_hour", self.settings.day_end_hour)
-        settings.setValue("day_time/end_minute", self.settings.day_end_minute)
-        settings.setValue("totals/year_display", self.settings.year_total_display)
-        settings.setValue("totals/week_start_day", self.settings.week_start_day)
-        settings.setValue("totals/week_end_day", self.settings.week_end_day)
-        settings.setValue("ui/show_heatmap", int(self.settings.show_heatmap))
-        settings.setValue("ui/show_day_time", int(self.settings.show_day_time))
-        settings.setValue("ui/show_total_today", int(self.settings.show_total_today))
-        settings.setValue("ui/show_year_total", int(self.settings.show_year_total))
-        settings.setValue(
-            "ui/show_super_goal_left", int(self.settings.show_super_goal_left)
-        )
-        settings.setValue("ui/show_status_label", int(self.settings.show_status_label))
-        settings.setValue(
-            "ui/show_start_button", int(self.settings.show_start_button)
-        )
-        settings.setValue(
-            "ui/show_clock_button", int(self.settings.show_clock_button)
-        )
-        settings.setValue(
-            "ui/show_longest_streak", int(self.settings.show_longest_streak)
-        )
-        settings.setValue(
-            "ui/show_current_streak", int(self.settings.show_current_streak)
-        )
-        settings.setValue("ui/use_24h_time", int(self.settings.use_24h_time))
+        for key, value in changed.items():
+            settings.setValue(key, value)
         settings.sync()
+        last_saved.update(changed)
 
     def _save_hotkey_settings(self) -> None:
         settings = get_settings()
-        settings.setValue("hotkeys/start", self.hotkey_settings.start_hotkey)
-        settings.setValue("hotkeys/clock", self.hotkey_settings.clock_hotkey)
-        settings.setValue(
-            "xinput/start_button", self.hotkey_settings.start_xinput_button
-        )
-        settings.setValue(
-            "xinput/clock_button", self.hotkey_settings.clock_xinput_button
-        )
+        for key, attr in HOTKEY_SETTINGS_SCHEMA:
+            settings.setValue(key, getattr(self.hotkey_settings, attr))
         settings.sync()
 
     def _save_super_goal(self) -> None:
@@ -6419,13 +7204,29 @@ class CountdownWindow(QMainWindow):
             and padding == self._heatmap_month_padding
         ):
             return False
+        same_layout = (padding > 0) == (self._heatmap_month_padding > 0)
         self._heatmap_cell_size = clamped
         self._heatmap_month_padding = padding
+        if same_layout and self._heatmap_column_is_cell:
+            self._resize_heatmap_cells()
+            return True
         self._clear_heatmap()
         self._populate_heatmap_cells(self._heatmap_year)
         self._refresh_heatmap()
         return True
 
+    def _resize_heatmap_cells(self) -> None:
+        size = self._heatmap_cell_size
+        for cell in self.heatmap_cells.values():
+            cell.setFixedSize(size, size)
+        for cell in self.heatmap_placeholder_cells:
+            cell.setFixedSize(size, size)
+        for spacer in self.month_label_spacers:
+            spacer.setFixedWidth(size)
+        for frame in self.month_padding_frames:
+            frame.setFixedWidth(self._heatmap_month_padding)
+        self._apply_heatmap_extent()
+
     def _set_base_heatmap_cell_size(self, size: int, save: bool = True) -> bool:
         clamped = max(HEATMAP_CELL_SIZE_MIN, min(HEATMAP_CELL_SIZE_MAX, int(size)))
         if clamped == self._heatmap_base_size:
@@ -6442,9 +7243,12 @@ class CountdownWindow(QMainWindow):
 
     def _build_heatmap(self) -> QWidget:
         self.heatmap_cells: dict[str, QFrame] = {}
+        self._heatmap_cell_styles: dict[str, tuple[int, int, int]] = {}
         self.heatmap_placeholder_cells: list[QFrame] = []
         self.month_label_widgets: list[QLabel] = []
         self.month_label_spacers: list[QFrame] = []
+        self.month_padding_frames: list[QFrame] = []
+        self._heatmap_column_is_cell: list[bool] = []
         self.month_labels_layout = QGridLayout()
         self.month_labels_layout.setContentsMargins(0, 0, 0, 0)
         self.month_labels_layout.setHorizontalSpacing(self._heatmap_spacing)
@@ -6453,6 +7257,7 @@ class CountdownWindow(QMainWindow):
         self.month_labels_widget.setObjectName("heatmapMonthLabels")
         self.month_labels_widget.setLayout(self.month_labels_layout)
         self.month_labels_widget.installEventFilter(self)
+        self._apply_month_label_style()
 
         self.heatmap_layout = QGridLayout()
         self.heatmap_layout.setContentsMargins(0, 0, 0, 0)
@@ -6477,6 +7282,16 @@ class CountdownWindow(QMainWindow):
         return self.heatmap_widget
 
     def _populate_heatmap_cells(self, year: int) -> None:
+        container = self.heatmap_widget
+        self._heatmap_dirty = True
+        container.setUpdatesEnabled(False)
+        try:
+            self._add_heatmap_cells(year)
+        finally:
+            container.setUpdatesEnabled(True)
+        container.updateGeometry()
+
+    def _add_heatmap_cells(self, year: int) -> None:
         for idx in range(self.month_labels_layout.columnCount()):
             self.month_labels_layout.setColumnMinimumWidth(idx, 0)
         for idx in range(self.heatmap_layout.columnCount()):
@@ -6496,36 +7311,25 @@ class CountdownWindow(QMainWindow):
             "Nov",
             "Dec",
         ]
-        label_font = QFont(self._font_family, self._heatmap_month_label_size)
-        label_color = qcolor_to_hex(self.settings.day_time_color)
         col = 0
-        spacer_count = 0
-        column_widths: list[int] = []
+        column_is_cell: list[bool] = []
 
         self.heatmap_cells.clear()
+        self._heatmap_cell_styles.clear()
         self.heatmap_placeholder_cells.clear()
-        for month in range(1, 13):
-            first_date = QDate(year, month, 1)
-            if not first_date.isValid():
-                continue
-            days_in_month = first_date.daysInMonth()
-            leading_blanks = first_date.dayOfWeek() - 1
-            total_cells = leading_blanks + days_in_month
-            trailing_blanks = (7 - (total_cells % 7)) % 7
-            weeks = (total_cells + trailing_blanks) // 7
-
+        for month, days_in_month, leading_blanks, weeks in month_geometry(year):
             label = QLabel(month_names[month - 1])
             label.setAlignment(Qt.AlignHCenter | Qt.AlignVCenter)
-            label.setFont(label_font)
-            label.setStyleSheet(f"color: {label_color};")
             label.setAttribute(Qt.WA_TransparentForMouseEvents, True)
             self.month_labels_layout.addWidget(
                 label, 0, col, 1, weeks, Qt.AlignHCenter | Qt.AlignVCenter
             )
             self.month_label_widgets.append(label)
 
+            key_prefix = f"{year:04d}-{month:02d}-"
+            shade = 1 if month % 2 == 0 else 0
             for week in range(weeks):
-                column_widths.append(self._heatmap_cell_size)
+                column_is_cell.append(True)
                 label_placeholder = QFrame()
                 label_placeholder.setAttribute(
                     Qt.WA_TransparentForMouseEvents, True
@@ -6547,11 +7351,11 @@ class CountdownWindow(QMainWindow):
                     cell.installEventFilter(self)
                     self.heatmap_layout.addWidget(cell, row, col + week)
                     if day_index < 0 or day_index >= days_in_month:
-                        self._apply_placeholder_style(cell)
                         self.heatmap_placeholder_cells.append(cell)
                     else:
-                        date = first_date.addDays(day_index)
-                        self.heatmap_cells[self._date_key(date)] = cell
+                        date_key = key_prefix + _TWO_DIGITS[day_index + 1]
+                        cell.setProperty("heatShade", shade)
+                        self.heatmap_cells[date_key] = cell
             col += weeks
 
             if self._heatmap_month_padding > 0 and month < 12:
@@ -6559,29 +7363,35 @@ class CountdownWindow(QMainWindow):
                 spacer.setAttribute(Qt.WA_TransparentForMouseEvents, True)
                 spacer.setFixedWidth(self._heatmap_month_padding)
                 self.heatmap_layout.addWidget(spacer, 0, col, 7, 1)
-                self.month_label_spacers.append(spacer)
+                self.month_padding_frames.append(spacer)
                 spacer_label = QFrame()
                 spacer_label.setAttribute(Qt.WA_TransparentForMouseEvents, True)
                 spacer_label.setFixedWidth(self._heatmap_month_padding)
                 self.month_labels_layout.addWidget(spacer_label, 0, col)
-                self.month_label_spacers.append(spacer_label)
+                self.month_padding_frames.append(spacer_label)
                 spacer_anchor = QFrame()
                 spacer_anchor.setAttribute(
                     Qt.WA_TransparentForMouseEvents, True
                 )
                 spacer_anchor.setFixedSize(self._heatmap_month_padding, 0)
                 self.month_labels_layout.addWidget(spacer_anchor, 1, col)
-                self.month_label_spacers.append(spacer_anchor)
-                column_widths.append(self._heatmap_month_padding)
-                spacer_count += 1
+                self.month_padding_frames.append(spacer_anchor)
+                column_is_cell.append(False)
                 col += 1
 
-        total_columns = len(column_widths)
-        for idx, width in enumerate(column_widths):
+        self._heatmap_column_is_cell = column_is_cell
+        self._apply_heatmap_extent()
+
+    def _apply_heatmap_extent(self) -> None:
+        column_is_cell = self._heatmap_column_is_cell
+        for idx, is_cell in enumerate(column_is_cell):
+            width = self._heatmap_cell_size if is_cell else self._heatmap_month_padding
             self.month_labels_layout.setColumnMinimumWidth(idx, width)
             self.heatmap_layout.setColumnMinimumWidth(idx, width)
 
-        cell_columns = total_columns - spacer_count
+        total_columns = len(column_is_cell)
+        cell_columns = sum(column_is_cell)
+        spacer_count = total_columns - cell_columns
         width = (
             cell_columns * self._heatmap_cell_size
             + spacer_count * self._heatmap_month_padding
@@ -6612,9 +7422,12 @@ class CountdownWindow(QMainWindow):
             if widget is not None:
                 widget.deleteLater()
         self.heatmap_cells.clear()
+        self._heatmap_cell_styles.clear()
         self.heatmap_placeholder_cells.clear()
         self.month_label_widgets.clear()
         self.month_label_spacers.clear()
+        self.month_padding_frames.clear()
+        self._heatmap_column_is_cell = []
 
     def _refresh_heatmap(self) -> None:
         current_year = QDate.currentDate().year()
@@ -6622,70 +7435,98 @@ class CountdownWindow(QMainWindow):
             self._heatmap_year = current_year
             self._clear_heatmap()
             self._populate_heatmap_cells(current_year)
-        for cell in self.heatmap_placeholder_cells:
-            self._apply_placeholder_style(cell)
-        for key in self.heatmap_cells:
-            self._update_heatmap_cell(key)
-
-    def _apply_placeholder_style(self, cell: QFrame) -> None:
-        cell.setStyleSheet(
-            "QFrame#heatmapCell {"
-            "border-radius: 2px;"
-            "background-color: rgba(0, 0, 0, 0);"
-            "}"
-        )
+        if not self._heatmap_dirty:
+            return
+        self._heatmap_dirty = False
+        grid = self.heatmap_grid_widget
+        grid.setUpdatesEnabled(False)
+        try:
+            self._apply_heatmap_cell_sheet()
+            today_key = self._date_key(QDate.currentDate())
+            for key in self.heatmap_cells:
+                self._update_heatmap_cell(key, today_key)
+        finally:
+            grid.setUpdatesEnabled(True)
+
+    def _request_heatmap_refresh(self) -> None:
+        if not self.isVisible():
+            self._refresh_heatmap()
+            return
+        if self._heatmap_refresh_pending:
+            return
+        self._heatmap_refresh_pending = True
+        QTimer.singleShot(0, self._run_pending_heatmap_refresh)
+
+    def _run_pending_heatmap_refresh(self) -> None:
+        self._heatmap_refresh_pending = False
+        self._refresh_heatmap()
 
-    def _heatmap_base_color(self, date_key: str) -> QColor:
-        date = QDate.fromString(date_key, "yyyy-MM-dd")
+    def _apply_heatmap_cell_sheet(self) -> None:
         base = self.settings.heatmap_color
-        if date.isValid() and date.month() % 2 == 0:
-            return base.lighter(125)
-        return base
+        hover = self.settings.heatmap_hover_cell_color
+        key = (base.rgb(), hover.rgb())
+        if key == self._heatmap_sheet_key:
+            return
+        self._heatmap_sheet_key = key
+        rules = [HEATMAP_CELL_BASE_RULE]
+        for shade, color in enumerate((base, base.lighter(125))):
+            red, green, blue = color.red(), color.green(), color.blue()
+            rules.extend(
+                HEATMAP_CELL_LEVEL_RULE.format(
+                    shade=shade, alpha=alpha, red=red, green=green, blue=blue
+                )
+                for alpha in HEATMAP_ALPHA_LEVELS
+            )
+        rules.append(HEATMAP_CELL_HOVER_RULE.format(color=qcolor_to_hex(hover)))
+        self.heatmap_grid_widget.setStyleSheet("".join(rules))
 
-    def _heatmap_cell_stylesheet(self, base: QColor, alpha: int) -> str:
-        hover_bg = qcolor_to_hex(self.settings.heatmap_hover_cell_color)
-        return (
-            "QFrame#heatmapCell {"
-            "border-radius: 2px;"
-            f"background-color: rgba({base.red()}, {base.green()}, {base.blue()},"
-            f"{alpha});"
-            "}"
-            "QFrame#heatmapCell:hover {"
-            f"background-color: {hover_bg};"
-            "}"
-        )
+    def _schedule_heatmap_cell(self, date_key: str) -> None:
+        self._heatmap_dirty_dates.add(date_key)
+        self._heatmap_refresh_timer.start()
 
-    def _update_heatmap_cell(self, date_key: str) -> None:
+    def _flush_heatmap_updates(self) -> None:
+        dirty_dates = self._heatmap_dirty_dates
+        self._heatmap_dirty_dates = set()
+        today_key = self._date_key(QDate.currentDate())
+        for date_key in dirty_dates:
+            self._update_heatmap_cell(date_key, today_key)
+
+    def _update_heatmap_cell(self, date_key: str, today_key: str) -> None:
         cell = self.heatmap_cells.get(date_key)
         if cell is None:
             return
-        base = self._heatmap_base_color(date_key)
         seconds = self._total_seconds_for_day(date_key)
-        goal_seconds = self._goal_seconds_for_date(date_key)
-        if goal_seconds > 0:
-            if seconds >= goal_seconds:
-                alpha = 220
-            elif seconds > 0:
-                alpha = 120
-            else:
-                alpha = 40
-        else:
-            alpha = 120 if seconds > 0 else 40
+        goal_seconds = self._goal_seconds_for_date(date_key, today_key)
+        applied = self._heatmap_cell_styles.get(date_key)
+        if applied is not None and applied[:2] == (seconds, goal_seconds):
+            return
+        alpha = heatmap_alpha(seconds, goal_seconds)
+        if applied is None or applied[2] != alpha:
+            # Dynamic properties are only re-read by the style on a repolish.
+            cell.setProperty("heatAlpha", alpha)
+            style = cell.style()
+            style.unpolish(cell)
+            style.polish(cell)
         percent = format_percent(seconds, goal_seconds)
-        tooltip = (
+        cell.setToolTip(
             f"Date: {date_key}\n"
             f"Time: {format_duration_hms(seconds)}\n"
             f"Super goal: {percent}"
         )
-        cell.setStyleSheet(self._heatmap_cell_stylesheet(base, alpha))
-        cell.setToolTip(tooltip)
+        self._heatmap_cell_styles[date_key] = (seconds, goal_seconds, alpha)
 
     def showEvent(self, event) -> None:
         super().showEvent(event)
         if self._acrylic_enabled:
-            apply_windows_acrylic(
-                int(self.winId()), self.settings.bg_color, self.settings.opacity
-            )
+            self._apply_acrylic()
+
+    def _apply_acrylic(self) -> None:
+        hwnd = int(self.winId())
+        state = (hwnd, self.settings.bg_color.rgba(), self.settings.opacity)
+        if state == self._acrylic_state:
+            return
+        self._acrylic_state = state
+        apply_windows_acrylic(hwnd, self.settings.bg_color, self.settings.opacity)
 
 
 def main() -> None: